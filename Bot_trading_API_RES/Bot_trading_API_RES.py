@@ -10,32 +10,96 @@ This bot monitors crypto pairs and generates trading signals
 
 import os
 import sys
+import time
 import asyncio
 import logging
-import json
-import yaml
-from datetime import datetime
+from logging.handlers import TimedRotatingFileHandler
+from signal import SIGINT, SIGTERM
+import orjson
+import aiohttp
+import websockets
+import numpy as np
+from collections import deque
+from itertools import islice
+from datetime import datetime, timezone
 from datetime import  timedelta  # Thêm import timedelta
 from typing import Dict, Any, List, Optional, Tuple
-from binance.client import Client
-from binance.exceptions import BinanceAPIException
+
+try:
+    from itertools import batched
+except ImportError:
+    # Python < 3.12
+    def batched(iterable, n):
+        """Yield successive n-sized tuples from iterable"""
+        iterator = iter(iterable)
+        while chunk := tuple(islice(iterator, n)):
+            yield chunk
 from shared.console_manager import ConsoleManager
 
 from shared.constants import (
+    BOT_USER,
     RSI_OVERBOUGHT,
     RSI_OVERSOLD,
     CONFIDENCE_THRESHOLD,
     VOLUME_RATIO_MIN,
+    MAX_CONCURRENT_REQUESTS,
+    BINANCE_WEIGHT_LIMIT,
+    BINANCE_API_URL,
+    BINANCE_STREAM_URL,
+    STREAM_MAX_FRAME,
+    HTTP_POOL_LIMIT,
+    HTTP_POOL_LIMIT_PER_HOST,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_TIMEOUT,
+    KLINE_INTERVAL,
+    KLINE_LIMIT,
+    KLINE_REFRESH_LIMIT,
+    STREAM_CHUNK_SIZE,
+    KLINE_BATCH_WINDOW,
+    PAIRS_CACHE_TTL,
+    VOLUMES_CACHE_TTL,
+    SIGNAL_DEDUP_TTL,
+    SIGNAL_DEDUP_MAXSIZE,
+    KLINES_WEIGHT,
+    TICKER_24H_WEIGHT,
+    EXCHANGE_INFO_WEIGHT,
+    PRICE_MOVE_TRIGGER,
+    SCAN_OVERRUN_WARN,
+    KLINE_OPEN_TIME,
     SCAN_MODE_ALL,
     SCAN_MODE_WATCHED
 )
+from shared.cache import ExpiringSet, ttl_cache
+from shared.config_loader import load_config_file
+from shared.event_loop import install_event_loop_policy, shutdown_loop
+from shared.indicators_numba import warm_up as warm_up_kernels
+from shared.klines import Klines
+from shared.log_queue import start_queue_logging
+from shared.rate_limiter import WeightLimiter
+from shared.time_utils import utc_now_str
 from shared.telegram_service import TelegramService
 from shared.signal_processor import SignalProcessor
+from shared.state_store import StateStore
+from shared.symbols import price_decimals, usdt_trading_symbols
 from shared.websocket_manager import WebSocketManager, MessageType
 
 class TradingBot:
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = (
+        'user', 'logger', 'telegram', 'ws_manager', '_is_running',
+        'monitored_pairs', 'watched_pairs', 'active_signals', '_recent_signals',
+        '_http', '_request_semaphore', '_weights', 'kline_windows',
+        '_stream_task', '_ticker_task', '_quote_volumes', '_stream_symbols',
+        '_scan_trigger', '_trigger_prices', '_moved_symbols', '_signals_by_symbol',
+        '_analysis_tasks', '_closed_klines', 'signal_processor', 'state_store', 'scanning_mode',
+        'update_interval', 'min_volume_usdt', 'max_concurrent_requests',
+        'weight_limit', 'console', '_log_listener'
+    )
+
     def __init__(self):
-        self.user = "Anhbaza01"
+        self.user = BOT_USER
+        self._log_listener = None
         self.logger = self._setup_logging()
         self.telegram = None
         self.ws_manager = None
@@ -43,16 +107,33 @@ class TradingBot:
         self.monitored_pairs = []
         self.watched_pairs = []
         self.active_signals = {}
-        self.client = None
+        self._recent_signals = ExpiringSet(SIGNAL_DEDUP_TTL, SIGNAL_DEDUP_MAXSIZE)
+        self._http = None
+        self._request_semaphore = None
+        self._weights = None
+        self.kline_windows: Dict[str, deque] = {}
+        self._stream_task = None
+        self._ticker_task = None
+        self._quote_volumes: Dict[str, float] = {}
+        self._stream_symbols = set()
+        self._scan_trigger = None
+        self._trigger_prices: Dict[str, float] = {}
+        self._moved_symbols = set()
+        self._signals_by_symbol: Dict[str, List[Dict]] = {}
+        self._analysis_tasks = set()
+        self._closed_klines: Dict[str, Klines] = {}
         self.signal_processor = None
+        self.state_store = None
         self.scanning_mode = SCAN_MODE_ALL
         self.update_interval = 300  # 5 minutes
         self.min_volume_usdt = 1000000  # $1M volume minimum
+        self.max_concurrent_requests = MAX_CONCURRENT_REQUESTS
+        self.weight_limit = BINANCE_WEIGHT_LIMIT
         
         # Khởi tạo console ở cuối để đảm bảo các biến khác đã được khởi tạo
         self.console = None
         
-        self.logger.info(f"Bot initialized at {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC")
+        self.logger.info(f"Bot initialized at {utc_now_str()} UTC")
         self.logger.info(f"User: {self.user}")
 
     def _setup_logging(self) -> logging.Logger:
@@ -62,20 +143,21 @@ class TradingBot:
             logs_dir = os.path.join(current_dir, 'logs')
             os.makedirs(logs_dir, exist_ok=True)
             
-            log_filename = os.path.join(
-                logs_dir, 
-                f'trading_bot_{datetime.utcnow().strftime("%Y%m%d")}.log'
-            )
+            # One file per UTC day, rotated at midnight, two weeks kept
+            log_filename = os.path.join(logs_dir, 'trading_bot.log')
             
-            logging.basicConfig(
-                level=logging.INFO,
-                format='%(asctime)s UTC | %(levelname)s | %(message)s',
-                handlers=[
-                    logging.FileHandler(log_filename),
-                    logging.StreamHandler(sys.stdout)
-                ],
-                datefmt='%Y-%m-%d %H:%M:%S'
+            # File and console writes happen on the listener thread
+            queue_handler, self._log_listener = start_queue_logging(
+                TimedRotatingFileHandler(
+                    log_filename,
+                    when='midnight',
+                    utc=True,
+                    backupCount=14,
+                    encoding='utf-8'
+                ),
+                logging.StreamHandler(sys.stdout)
             )
+            logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
             
             logger = logging.getLogger("TradingBot")
             
@@ -83,7 +165,7 @@ class TradingBot:
             logger.info("Trading Bot - Logging Initialized")
             logger.info(f"Log Level: {logging.getLevelName(logger.getEffectiveLevel())}")
             logger.info(f"Log File: {log_filename}")
-            logger.info(f"Current Time (UTC): {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}")
+            logger.info(f"Current Time (UTC): {utc_now_str()}")
             logger.info(f"User: {self.user}")
             logger.info("="*50)
             
@@ -99,6 +181,18 @@ class TradingBot:
             )
             return logging.getLogger("TradingBot")
 
+    def stop(self):
+        """Stop the main loop now instead of at its next wake-up"""
+        self._is_running = False
+        if self._scan_trigger:
+            self._scan_trigger.set()
+
+    def stop_logging(self):
+        """Flush queued log records and stop the listener thread"""
+        if self._log_listener:
+            self._log_listener.stop()
+            self._log_listener = None
+
     async def load_config(self) -> bool:
         """Load configuration from file"""
         try:
@@ -107,8 +201,7 @@ class TradingBot:
                 'config.yaml'
             )
             
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            config = await asyncio.to_thread(load_config_file, config_path)
                 
             # Load Telegram config
             telegram_config = config.get('telegram', {})
@@ -122,6 +215,10 @@ class TradingBot:
             trading_config = config.get('trading', {})
             self.update_interval = trading_config.get('update_interval', 300)
             self.min_volume_usdt = trading_config.get('min_volume_usdt', 1000000)
+            self.max_concurrent_requests = trading_config.get(
+                'max_concurrent_requests', MAX_CONCURRENT_REQUESTS
+            )
+            self.weight_limit = trading_config.get('weight_limit', BINANCE_WEIGHT_LIMIT)
             
             self.logger.info("[+] Configuration loaded successfully")
             return True
@@ -135,11 +232,23 @@ class TradingBot:
         try:
             self.logger.info("[*] Connecting to Binance...")
             
-            # Initialize without API keys for public data only
-            self.client = Client()
+            # REST reads go through _api_get on the session below,
+            # market streams are read directly with websockets
+            self._request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+            self._weights = WeightLimiter(self.weight_limit)
+            
+            # Long-lived keep-alive pool for hot market data reads
+            self._http = aiohttp.ClientSession(
+                connector=self._pooled_connector(),
+                # aiohttp's 5 minute default would hold a semaphore slot that long
+                timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT),
+                # aiohttp already negotiates gzip/deflate (and br with Brotli)
+                auto_decompress=True,
+                json_serialize=lambda obj: orjson.dumps(obj).decode()
+            )
             
             # Test connection
-            server_time = self.client.get_server_time()
+            server_time = await self._api_get("/api/v3/time", 1)
             if not server_time:
                 raise ConnectionError("Could not get server time")
                 
@@ -150,6 +259,16 @@ class TradingBot:
             self.logger.error(f"[-] Binance setup error: {str(e)}")
             return False
 
+    @staticmethod
+    def _pooled_connector() -> aiohttp.TCPConnector:
+        """Keep-alive connection pool: one TLS handshake per connection, not per request"""
+        return aiohttp.TCPConnector(
+            limit=HTTP_POOL_LIMIT,
+            limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT
+        )
+
     async def setup_websocket(self) -> bool:
         """Setup WebSocket connection"""
         try:
@@ -196,34 +315,24 @@ class TradingBot:
             return False
 
     async def get_valid_pairs(self) -> List[str]:
-        """Get list of valid trading pairs"""
+        """Get USDT pairs above the volume minimum, sorted by volume"""
         try:
-            # Get exchange info
-            info = self.client.get_exchange_info()
-            
-            # Get 24hr stats for volume filtering
-            tickers = self.client.get_ticker()
-            volume_dict = {
-                t['symbol']: float(t['quoteVolume']) 
-                for t in tickers
-            }
+            (symbols, _), volume_dict = await asyncio.gather(
+                self._fetch_symbol_info(),
+                self.get_all_tickers_24h()
+            )
             
-            # Filter valid pairs
-            valid_pairs = []
-            for symbol in info['symbols']:
-                # Check if pair is valid for trading
-                if (symbol['status'] == 'TRADING' and
-                    symbol['quoteAsset'] == 'USDT' and
-                    symbol['symbol'] in volume_dict and
-                    volume_dict[symbol['symbol']] >= self.min_volume_usdt):
-                    valid_pairs.append(symbol['symbol'])
-            
-            # Sort by volume
-            valid_pairs.sort(
-                key=lambda x: volume_dict[x],
-                reverse=True
+            # Fresh 24hr volumes every call, only the symbol list is cached
+            get_volume = volume_dict.get
+            volumes = np.fromiter(
+                (get_volume(s, -1.0) for s in symbols), dtype=np.float64, count=len(symbols)
             )
             
+            # Threshold and descending order on the array, ties keep exchange order
+            order = np.argsort(-volumes, kind='stable')
+            order = order[volumes[order] >= self.min_volume_usdt]
+            valid_pairs = [symbols[i] for i in order.tolist()]
+            
             self.logger.info(f"[+] Found {len(valid_pairs)} valid pairs")
             
             # Log top 5 pairs by volume
@@ -240,133 +349,236 @@ class TradingBot:
             self.logger.error(f"[-] Error getting valid pairs: {str(e)}")
             return []
 
-    async def get_klines(self, symbol: str) -> Optional[List[Dict]]:
+    @ttl_cache(ttl=PAIRS_CACHE_TTL)
+    async def _fetch_symbol_info(self) -> Tuple[List[str], Dict[str, int]]:
+        """
+        USDT symbols open for trading and price decimals of every symbol,
+        both built from one exchange info download (cached in memory and on disk)
+        """
+        pairs_file = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), 'logs', 'pairs.json'
+        )
+        
+        # Lookups saved by a recent run spare the exchange info download
+        try:
+            if time.time() - os.path.getmtime(pairs_file) < PAIRS_CACHE_TTL:
+                with open(pairs_file, 'rb') as f:
+                    cached = orjson.loads(f.read())
+                return cached['symbols'], cached['price_decimals']
+        except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+            pass
+            
+        info = await self._get_exchange_info()
+        symbols = usdt_trading_symbols(info)
+        decimals = price_decimals(info)
+        
+        try:
+            with open(pairs_file, 'wb') as f:
+                f.write(orjson.dumps({'symbols': symbols, 'price_decimals': decimals}))
+        except OSError as e:
+            self.logger.warning(f"[!] Could not save pairs cache: {str(e)}")
+            
+        return symbols, decimals
+
+    async def _get_exchange_info(self) -> Dict[str, Any]:
+        """Download exchange info for all symbols"""
+        return await self._api_get("/api/v3/exchangeInfo", EXCHANGE_INFO_WEIGHT)
+
+    async def _api_get(self, path: str, weight: int, **params) -> Any:
+        """
+        GET a public REST endpoint on the pooled session
+        
+        Parameters:
+            path (str): Endpoint path, e.g. /api/v3/klines
+            weight (int): Request weight charged against the limiter
+            **params: Query parameters
+            
+        Returns:
+            Any: Decoded JSON body
+        """
+        try:
+            async with self._request_semaphore:
+                await self._weights.acquire(weight)
+                async with self._http.get(
+                    f"{BINANCE_API_URL}{path}",
+                    params=params or None
+                ) as response:
+                    self._weights.update(response.headers)
+                    response.raise_for_status()
+                    # orjson parses the raw body (no str decode or
+                    # content-type check as in response.json())
+                    return orjson.loads(await response.read())
+                    
+        except aiohttp.ClientResponseError as e:
+            if e.status in (418, 429):
+                # Rate limited: pause every request for Retry-After seconds
+                self._weights.back_off(int((e.headers or {}).get('Retry-After', 60)))
+            raise
+
+    async def get_all_tickers_24h(self) -> Dict[str, float]:
+        """Get 24hr quote volume of every symbol"""
+        # Kept current by the mini ticker stream once seeded
+        if self._quote_volumes and self._ticker_task and not self._ticker_task.done():
+            return self._quote_volumes
+            
+        volumes_file = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), 'logs', 'volumes.json'
+        )
+        
+        # Volumes saved by a run restarted within minutes spare the download,
+        # updated in place since the ticker stream holds a reference to this dict
+        try:
+            if time.time() - os.path.getmtime(volumes_file) < VOLUMES_CACHE_TTL:
+                with open(volumes_file, 'rb') as f:
+                    self._quote_volumes.update(orjson.loads(f.read()))
+                return self._quote_volumes
+        except (OSError, orjson.JSONDecodeError, TypeError, ValueError):
+            pass
+            
+        # One request for all symbols
+        tickers = await self._api_get("/api/v3/ticker/24hr", TICKER_24H_WEIGHT)
+                
+        # Numeric strings parse to float64 in one C-level conversion
+        volumes = np.array([t['quoteVolume'] for t in tickers], dtype=np.float64)
+        
+        self._quote_volumes.update(zip([t['symbol'] for t in tickers], volumes.tolist()))
+        
+        try:
+            with open(volumes_file, 'wb') as f:
+                f.write(orjson.dumps(self._quote_volumes))
+        except OSError as e:
+            self.logger.warning(f"[!] Could not save volumes cache: {str(e)}")
+            
+        return self._quote_volumes
+
+    async def get_klines(self, symbol: str, limit: int = KLINE_LIMIT) -> Optional[Klines]:
         """Get kline data for a symbol"""
         try:
-            # Get 100 15-minute candles
-            klines = self.client.get_klines(
+            # Latest 15-minute candles, 100 by default
+            klines = await self._api_get(
+                "/api/v3/klines",
+                KLINES_WEIGHT,
                 symbol=symbol,
-                interval=Client.KLINE_INTERVAL_15MINUTE,
-                limit=100
+                interval=KLINE_INTERVAL,
+                limit=limit
             )
             
-            # Convert to dict format
-            formatted_klines = []
-            for k in klines:
-                formatted_klines.append({
-                    'time': k[0],
-                    'open': float(k[1]),
-                    'high': float(k[2]),
-                    'low': float(k[3]),
-                    'close': float(k[4]),
-                    'volume': float(k[5]),
-                    'close_time': k[6],
-                    'quote_volume': float(k[7])
-                })
-                
-            return formatted_klines
+            # Convert to one float64 array per field
+            return Klines.from_rows(klines)
             
-        except BinanceAPIException as e:
-            self.logger.error(f"[-] Binance API error getting klines for {symbol}: {str(e)}")
+        except aiohttp.ClientResponseError as e:
+            self.logger.error(f"[-] Binance API error getting klines for {symbol}: {e.status} {e.message}")
             return None
         except Exception as e:
             self.logger.error(f"[-] Error getting klines for {symbol}: {str(e)}")
             return None
 
-    async def process_signal(self, symbol: str, klines: List[Dict]) -> Optional[Dict]:
+    async def process_signal(self, symbol: str, klines: Klines) -> Optional[Dict]:
         """Process and generate trading signal"""
+        # Bound once; per-symbol trace lines are DEBUG, outcomes stay INFO
+        log = self.logger
+        
         try:
-            # Log start of processing
-            self.logger.info(f"[SCAN] Analyzing {symbol}...")
+            log.debug("[SCAN] Analyzing %s...", symbol)
 
             # Check data validity
-            if not klines:
-                self.logger.info(f"[-] {symbol}: No kline data available")
+            if klines is None or len(klines) == 0:
+                log.debug("[-] %s: No kline data available", symbol)
                 return None
                 
             if len(klines) < 50:
-                self.logger.info(f"[-] {symbol}: Insufficient kline data (need 50, got {len(klines)})")
+                log.debug("[-] %s: Insufficient kline data (need 50, got %d)", symbol, len(klines))
                 return None
                 
             # Calculate RSI
-            closes = [k['close'] for k in klines]
-            rsi = self.signal_processor._calculate_rsi(closes)
+            rsi, volume_ratio = self.signal_processor.update_indicators(symbol, klines)
             
             if rsi is None:
-                self.logger.info(f"[-] {symbol}: Failed to calculate RSI")
+                log.info("[-] %s: Failed to calculate RSI", symbol)
                 return None
                 
             # Log RSI value
             if rsi <= RSI_OVERSOLD:
-                self.logger.info(f"[+] {symbol}: RSI = {rsi:.2f} (Oversold)")
+                log.info("[+] %s: RSI = %.2f (Oversold)", symbol, rsi)
             elif rsi >= RSI_OVERBOUGHT:
-                self.logger.info(f"[+] {symbol}: RSI = {rsi:.2f} (Overbought)")
+                log.info("[+] %s: RSI = %.2f (Overbought)", symbol, rsi)
             else:
-                self.logger.info(f"[-] {symbol}: RSI = {rsi:.2f} (Neutral)")
+                log.debug("[-] %s: RSI = %.2f (Neutral)", symbol, rsi)
             
             # Check conditions for signal
             signal_type = None
             if rsi <= RSI_OVERSOLD:
-                volume_signal = self.signal_processor.check_volume_signal(klines)
+                volume_signal = self.signal_processor.check_volume_signal(klines, volume_ratio)
                 if volume_signal == "LONG":
-                    self.logger.info(f"[+] {symbol}: Volume breakout confirmed for LONG")
+                    log.info("[+] %s: Volume breakout confirmed for LONG", symbol)
                     signal_type = "LONG"
                 else:
-                    self.logger.info(f"[-] {symbol}: No volume confirmation for LONG")
+                    log.debug("[-] %s: No volume confirmation for LONG", symbol)
                     
             elif rsi >= RSI_OVERBOUGHT:
-                volume_signal = self.signal_processor.check_volume_signal(klines)
+                volume_signal = self.signal_processor.check_volume_signal(klines, volume_ratio)
                 if volume_signal == "SHORT":
-                    self.logger.info(f"[+] {symbol}: Volume breakout confirmed for SHORT")
+                    log.info("[+] %s: Volume breakout confirmed for SHORT", symbol)
                     signal_type = "SHORT"
                 else:
-                    self.logger.info(f"[-] {symbol}: No volume confirmation for SHORT")
+                    log.debug("[-] %s: No volume confirmation for SHORT", symbol)
                     
             if signal_type:
-                current_price = klines[-1]['close']
-                self.logger.info(f"[*] {symbol}: Calculating targets for {signal_type} @ {current_price}")
+                current_price = float(klines.close[-1])
+                log.debug("[*] %s: Calculating targets for %s @ %s", symbol, signal_type, current_price)
                 
-                targets = self.calculate_targets(symbol, signal_type, current_price)
+                targets = await self.calculate_targets(symbol, signal_type, current_price)
                 
                 if targets['tp'] and targets['sl']:
+                    # One clock read: integer ns for the id, datetime for display
+                    now_ns = time.time_ns()
                     signal = {
-                        'id': f"{symbol}_{datetime.utcnow().timestamp()}",
+                        'id': f"{symbol}_{now_ns}",
                         'symbol': symbol,
                         'type': signal_type,
                         'entry': current_price,
                         'tp': targets['tp'],
                         'sl': targets['sl'],
-                        'time': datetime.utcnow(),
-                        'rsi': rsi
+                        'time': datetime.fromtimestamp(now_ns / 1e9, timezone.utc),
+                        'rsi': rsi,
+                        'decimals': targets['decimals']
                     }
                     
                     # Calculate confidence
-                    signal['confidence'] = self.signal_processor.calculate_confidence(signal, klines)
+                    signal['confidence'] = self.signal_processor.calculate_confidence(
+                        signal, klines, volume_ratio
+                    )
                     
                     if signal['confidence'] >= CONFIDENCE_THRESHOLD:
-                        self.logger.info(
-                            f"[!] {symbol}: SIGNAL FOUND!\n"
-                            f"    Type: {signal_type}\n"
-                            f"    Entry: {current_price:.2f}\n"
-                            f"    TP: {targets['tp']:.2f}\n"
-                            f"    SL: {targets['sl']:.2f}\n"
-                            f"    Confidence: {signal['confidence']}%"
+                        log.info(
+                            "[!] %s: SIGNAL FOUND!\n"
+                            "    Type: %s\n"
+                            "    Entry: %.*f\n"
+                            "    TP: %.*f\n"
+                            "    SL: %.*f\n"
+                            "    Confidence: %s%%",
+                            symbol, signal_type,
+                            targets['decimals'], current_price,
+                            targets['decimals'], targets['tp'],
+                            targets['decimals'], targets['sl'],
+                            signal['confidence']
                         )
                         return signal
                     else:
-                        self.logger.info(
-                            f"[-] {symbol}: Low confidence ({signal['confidence']}% < {CONFIDENCE_THRESHOLD}%)"
+                        log.info(
+                            "[-] %s: Low confidence (%s%% < %s%%)",
+                            symbol, signal['confidence'], CONFIDENCE_THRESHOLD
                         )
                 else:
-                    self.logger.info(f"[-] {symbol}: Invalid TP/SL levels")
+                    log.info("[-] %s: Invalid TP/SL levels", symbol)
             
             return None
             
         except Exception as e:
-            self.logger.error(f"[ERROR] Processing {symbol}: {str(e)}")
+            log.error("[ERROR] Processing %s: %s", symbol, e, exc_info=True)
             return None
 
-    def calculate_targets(
+    async def calculate_targets(
         self, 
         symbol: str, 
         signal_type: str, 
@@ -374,9 +586,9 @@ class TradingBot:
     ) -> Dict[str, Optional[float]]:
         """Calculate take profit and stop loss levels"""
         try:
-            # Get symbol info for price precision
-            info = self.client.get_symbol_info(symbol)
-            precision = len(info['filters'][0]['tickSize'].rstrip('0').split('.')[1])
+            # Price precision from the lookup built with the pair list
+            _, decimals = await self._fetch_symbol_info()
+            precision = decimals.get(symbol, 8)
             
             if signal_type == "LONG":
                 tp = round(entry_price * 1.02, precision)  # 2% profit
@@ -385,7 +597,7 @@ class TradingBot:
                 tp = round(entry_price * 0.98, precision)  # 2% profit
                 sl = round(entry_price * 1.01, precision)  # 1% loss
                 
-            return {'tp': tp, 'sl': sl}
+            return {'tp': tp, 'sl': sl, 'decimals': precision}
             
         except Exception as e:
             self.logger.error(f"[-] Error calculating targets for {symbol}: {str(e)}")
@@ -406,6 +618,10 @@ class TradingBot:
             if pairs:
                 self.logger.info(f"[*] Pairs: {', '.join(pairs)}")
             
+            # Subscribe to any pair the kline stream does not cover yet
+            if self._stream_task and not set(pairs) <= self._stream_symbols:
+                self.start_kline_stream()
+            
         except Exception as e:
             self.logger.error(f"[-] Error handling watch pairs: {str(e)}")
 
@@ -430,30 +646,44 @@ class TradingBot:
             self.console = ConsoleManager("Trading Bot")
             self.console.start()
             
+            # Compile indicator kernels on a worker thread while connecting
+            kernels_ready = asyncio.get_running_loop().run_in_executor(None, warm_up_kernels)
+            
             # Load config
             if not await self.load_config():
                 self.logger.error("[-] Failed to load config")
                 return False
                 
-            # Setup Binance connection
-            if not await self.setup_binance():
+            # Binance and WebSocket connections are independent, set up together
+            binance_ready, websocket_ready = await asyncio.gather(
+                self.setup_binance(),
+                self.setup_websocket()
+            )
+            if not binance_ready:
                 self.logger.error("[-] Failed to setup Binance")
                 return False
                 
-            # Setup WebSocket
-            if not await self.setup_websocket():
+            if not websocket_ready:
                 self.logger.error("[-] Failed to setup WebSocket")
                 return False
                 
             # Initialize signal processor
             self.signal_processor = SignalProcessor(logger=self.logger)
             
+            # Restore indicator state from the previous run
+            self.state_store = StateStore(
+                os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs', 'indicator_state.db'),
+                logger=self.logger
+            )
+            self.signal_processor.import_state(self.state_store.load())
+            
             # Get valid trading pairs
             self.monitored_pairs = await self.get_valid_pairs()
             if not self.monitored_pairs:
                 self.logger.error("[-] No valid pairs found")
                 return False
                 
+            await kernels_ready
             return True
             
         except Exception as e:
@@ -472,91 +702,329 @@ class TradingBot:
                 f"({'watched' if self.scanning_mode == SCAN_MODE_WATCHED else 'all'})"
             )
             
-            for symbol in pairs_to_scan:
-                try:
-                    # Get klines
-                    klines = await self.get_klines(symbol)
-                    if not klines:
-                        continue
-                        
-                    # Process for signals
-                    new_signal = await self.process_signal(symbol, klines)
+            # Requests overlap on the client's connection pool,
+            # _request_semaphore keeps us under the API weight limit
+            results = await asyncio.gather(
+                *(self.load_klines(symbol) for symbol in pairs_to_scan)
+            )
+            fetched = {
+                symbol: klines
+                for symbol, klines in zip(pairs_to_scan, results)
+                if klines is not None
+            }
+            
+            # Indicator state for all symbols in one parallel kernel call
+            # on a worker thread (kernels release the GIL) so sockets keep
+            # being served, then a vectorized RSI/volume screen
+            loop = asyncio.get_running_loop()
+            seeded = await loop.run_in_executor(None, self.signal_processor.seed_batch, fetched)
+            
+            # State is only written on the loop thread, where the kline
+            # stream and update_indicators also advance it
+            self.signal_processor.import_state(seeded)
+            candidates, advanced = self.signal_processor.screen_candidates(fetched)
+            self.signal_processor.import_state(advanced)
+            self.logger.info(f"[*] {len(candidates)}/{len(fetched)} pairs passed screening")
+            
+            await asyncio.gather(
+                *(self.analyze_symbol(symbol, fetched[symbol]) for symbol in candidates)
+            )
+                
+        except Exception as e:
+            self.logger.error(f"[-] Error in scan_pairs: {str(e)}")
+
+    async def load_klines(self, symbol: str) -> Optional[Klines]:
+        """Fetch klines and seed the symbol's rolling window"""
+        try:
+            window = self.kline_windows.get(symbol)
+            if window is not None and len(window) == KLINE_LIMIT:
+                # Warm window: fetch only the newest candles and top it up
+                recent = await self.get_klines(symbol, KLINE_REFRESH_LIMIT)
+                if recent is not None and len(recent) and recent.ts[0] <= window[-1][KLINE_OPEN_TIME]:
+                    while window and window[-1][KLINE_OPEN_TIME] >= recent.ts[0]:
+                        window.pop()
+                    window.extend(recent.rows())
+                    return Klines.from_rows(window)
                     
-                    if new_signal:
-                        # Store signal
-                        self.active_signals[new_signal['id']] = new_signal
-                        
-                        # Send to order manager
-                        if self.ws_manager:
-                            await self.ws_manager.send_signal(new_signal)
-                            
-                        # Notify on Telegram
-                        if self.telegram:
-                            await self.telegram.send_signal(new_signal)
+            klines = await self.get_klines(symbol)
+            if klines is None or len(klines) == 0:
+                return None
+                
+            # Seed rolling window for the kline stream
+            self.kline_windows[symbol] = deque(klines.rows(), maxlen=KLINE_LIMIT)
+            return klines
+            
+        except Exception as e:
+            self.logger.error(f"[-] Error loading klines for {symbol}: {str(e)}")
+            return None
+
+    async def process_symbol(self, symbol: str):
+        """Fetch klines, analyze and dispatch signal for one symbol"""
+        try:
+            klines = await self.load_klines(symbol)
+            if klines is not None:
+                await self.analyze_symbol(symbol, klines)
+            
+        except Exception as e:
+            self.logger.error(f"[-] Error scanning {symbol}: {str(e)}")
+
+    async def analyze_symbol(self, symbol: str, klines: Klines):
+        """Analyze klines and dispatch new signal"""
+        try:
+            # Process for signals
+            new_signal = await self.process_signal(symbol, klines)
+            
+            if new_signal:
+                # Same symbol and direction already sent recently
+                if not self._recent_signals.add((symbol, new_signal['type'])):
+                    self.logger.info("[-] %s: %s signal already sent recently", symbol, new_signal['type'])
+                    return
                     
-                except Exception as e:
-                    self.logger.error(f"[-] Error scanning {symbol}: {str(e)}")
-                    continue
+                # Store signal, TP/SL are checked against streamed prices
+                self.active_signals[new_signal['id']] = new_signal
+                self._signals_by_symbol.setdefault(symbol, []).append(new_signal)
+                
+                # Send to order manager
+                if self.ws_manager:
+                    await self.ws_manager.send_signal(new_signal)
                     
-                # Small delay between pairs
-                await asyncio.sleep(0.5)
+                # Notify on Telegram
+                if self.telegram:
+                    await self.telegram.send_signal(new_signal)
+            
+        except Exception as e:
+            self.logger.error(f"[-] Error analyzing {symbol}: {str(e)}")
+
+    def start_kline_stream(self):
+        """(Re)start kline stream for monitored and watched pairs"""
+        if self._stream_task:
+            self._stream_task.cancel()
+        self._stream_symbols = set(self.monitored_pairs) | set(self.watched_pairs)
+        self._stream_task = asyncio.create_task(self.stream_klines())
+
+    async def stream_klines(self):
+        """Subscribe to kline streams through multiplexed sockets"""
+        try:
+            streams = [
+                f"{symbol.lower()}@kline_{KLINE_INTERVAL}"
+                for symbol in sorted(self._stream_symbols)
+            ]
+            
+            self.logger.info(
+                f"[*] Subscribing to {len(streams)} kline streams "
+                f"over {-(-len(streams) // STREAM_CHUNK_SIZE)} sockets"
+            )
+            await asyncio.gather(
+                *(self._consume_kline_stream(list(c)) for c in batched(streams, STREAM_CHUNK_SIZE))
+            )
+            
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.error(f"[-] Error in kline stream: {str(e)}")
+
+    async def _consume_kline_stream(self, streams: List[str]):
+        """Read one multiplexed socket, reconnecting on failure"""
+        # Combined stream frames wrap each event as {"stream": ..., "data": ...}
+        url = f"{BINANCE_STREAM_URL}/stream?streams={'/'.join(streams)}"
+        
+        while self._is_running:
+            try:
+                async with websockets.connect(url, max_size=STREAM_MAX_FRAME) as stream:
+                    while self._is_running:
+                        msg = orjson.loads(await stream.recv())
+                        kline = msg.get('data', {}).get('k') if msg else None
+                        
+                        # Only closed candles trigger analysis
+                        if kline and kline['x']:
+                            self.on_kline_closed(kline)
+                            
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"[-] Kline socket error: {str(e)}")
+                await asyncio.sleep(5)
+
+    async def stream_mini_tickers(self):
+        """Keep 24hr quote volumes current from the all-market mini ticker stream"""
+        # Parsed with orjson: the frame lists every changed symbol each second
+        url = f"{BINANCE_STREAM_URL}/ws/!miniTicker@arr"
+        
+        # Bound once, the loop below runs for every symbol every second
+        quote_volumes = self._quote_volumes
+        check_price_move = self._check_price_move
+        signals_by_symbol = self._signals_by_symbol
+        check_targets = self._check_targets
+        
+        while self._is_running:
+            try:
+                async with websockets.connect(url, max_size=STREAM_MAX_FRAME) as stream:
+                    while self._is_running:
+                        msg = orjson.loads(await stream.recv())
+                        
+                        # Only symbols that changed in the last second are sent
+                        if isinstance(msg, list):
+                            for ticker in msg:
+                                symbol = ticker['s']
+                                price = float(ticker['c'])
+                                quote_volumes[symbol] = float(ticker['q'])
+                                check_price_move(symbol, price)
+                                if symbol in signals_by_symbol:
+                                    check_targets(symbol, price)
+                                
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"[-] Mini ticker socket error: {str(e)}")
+                await asyncio.sleep(5)
+
+    def _check_price_move(self, symbol: str, price: float):
+        """Wake the main loop when a streamed pair moved PRICE_MOVE_TRIGGER since last analysis"""
+        if symbol not in self._stream_symbols:
+            return
+            
+        reference = self._trigger_prices.get(symbol)
+        if reference is None:
+            self._trigger_prices[symbol] = price
+        elif abs(price - reference) > reference * PRICE_MOVE_TRIGGER:
+            self._trigger_prices[symbol] = price
+            self._moved_symbols.add(symbol)
+            self._scan_trigger.set()
+
+    def _check_targets(self, symbol: str, price: float):
+        """Close active signals of symbol whose TP or SL the streamed price reached"""
+        signals = self._signals_by_symbol[symbol]
+        for signal in list(signals):
+            if signal['type'] == "LONG":
+                reason = 'TP' if price >= signal['tp'] else 'SL' if price <= signal['sl'] else None
+            else:  # SHORT
+                reason = 'TP' if price <= signal['tp'] else 'SL' if price >= signal['sl'] else None
+            if reason is None:
+                continue
+                
+            signals.remove(signal)
+            self.active_signals.pop(signal['id'], None)
+            signal['close_price'] = price
+            signal['close_reason'] = reason
+            self.logger.info(
+                "[*] %s: %s signal hit %s @ %.*f",
+                symbol, signal['type'], reason, signal.get('decimals', 8), price
+            )
+            self._schedule(self.close_signal(signal))
+            
+        if not signals:
+            del self._signals_by_symbol[symbol]
+
+    async def close_signal(self, signal: Dict[str, Any]):
+        """Send signal close to order manager and Telegram"""
+        try:
+            if self.ws_manager:
+                await self.ws_manager.send_signal_close(signal)
+                
+            if self.telegram:
+                self.telegram.queue_message(
+                    self.signal_processor.format_signal_message(signal, "CLOSE")
+                )
                 
         except Exception as e:
-            self.logger.error(f"[-] Error in scan_pairs: {str(e)}")
-    async def update_display(self):
-        """Update console display"""
+            self.logger.error(f"[-] Error closing signal {signal['id']}: {str(e)}")
+
+    async def scan_moved_pairs(self):
+        """Analyze pairs flagged by the price move trigger right away"""
         try:
-            # Clear console
-            os.system('cls' if os.name == 'nt' else 'clear')
-            
-            # Print header
-            print("\n=== Trading Bot Status ===")
-            print(f"Time (UTC): {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"User: {self.user}")
-            print("="*25)
-            
-            # Print scanning mode
-            mode = "WATCHED PAIRS" if self.scanning_mode == SCAN_MODE_WATCHED else "ALL PAIRS"
-            print(f"\nScanning Mode: {mode}")
-            
-            # Print pairs being monitored
-            pairs_to_scan = self.watched_pairs if self.scanning_mode == SCAN_MODE_WATCHED else self.monitored_pairs
-            print(f"Monitoring: {len(pairs_to_scan)} pairs")
-            
-            if self.scanning_mode == SCAN_MODE_WATCHED and self.watched_pairs:
-                print("\nWatched Pairs:")
-                print(", ".join(self.watched_pairs))
-            
-            # Print active signals
-            if self.active_signals:
-                print("\nActive Signals:")
-                for signal_id, signal in self.active_signals.items():
-                    print(
-                        f"\n{signal['symbol']} - {signal['type']}\n"
-                        f"Entry: {signal['entry']:.8f}\n"
-                        f"TP: {signal['tp']:.8f}\n"
-                        f"SL: {signal['sl']:.8f}\n"
-                        f"RSI: {signal['rsi']:.2f}\n"
-                        f"Confidence: {signal.get('confidence', 0)}%"
-                    )
-            else:
-                print("\nNo active signals")
+            self._scan_trigger.clear()
+            moved, self._moved_symbols = self._moved_symbols, set()
+            
+            pairs_to_scan = set(
+                self.watched_pairs if self.scanning_mode == SCAN_MODE_WATCHED
+                else self.monitored_pairs
+            )
+            moved &= pairs_to_scan
+            if moved:
+                self.logger.info("[*] Price moved on %d pairs, analyzing now", len(moved))
+                await asyncio.gather(*(self.process_symbol(symbol) for symbol in moved))
+                
+        except Exception as e:
+            self.logger.error(f"[-] Error scanning moved pairs: {str(e)}")
+
+    def on_kline_closed(self, kline: Dict[str, Any]):
+        """Update rolling window and schedule analysis for closed candle"""
+        try:
+            symbol = kline['s']
+            window = self.kline_windows.get(symbol)
+            
+            if window is None:
+                # No history yet, warm up over REST
+                self._schedule(self.process_symbol(symbol))
+                return
+                
+            candle = (
+                float(kline['t']),
+                float(kline['o']),
+                float(kline['h']),
+                float(kline['l']),
+                float(kline['c']),
+                float(kline['v'])
+            )
             
-            # Print next scan time
-            next_scan = datetime.utcnow().timestamp() + self.update_interval
-            next_scan_time = datetime.fromtimestamp(next_scan).strftime('%H:%M:%S')
-            print(f"\nNext scan at: {next_scan_time} UTC")
+            # Replace the in-progress candle seeded from REST
+            if window and window[-1][KLINE_OPEN_TIME] == candle[KLINE_OPEN_TIME]:
+                window[-1] = candle
+            else:
+                window.append(candle)
+                
+            pairs_to_scan = (
+                self.watched_pairs if self.scanning_mode == SCAN_MODE_WATCHED
+                else self.monitored_pairs
+            )
+            if symbol in pairs_to_scan:
+                # Candles close together at the interval boundary: the
+                # first one opens a batch, the rest join it
+                if not self._closed_klines:
+                    self._schedule(self.analyze_closed_batch())
+                self._closed_klines[symbol] = Klines.from_rows(window)
+                
+        except Exception as e:
+            self.logger.error(f"[-] Error handling closed kline: {str(e)}")
+
+    async def analyze_closed_batch(self):
+        """Screen a burst of closed candles at once, analyze the candidates"""
+        try:
+            await asyncio.sleep(KLINE_BATCH_WINDOW)
+            batch, self._closed_klines = self._closed_klines, {}
             
-            # Print connection status
-            ws_status = "[CONNECTED]" if self.ws_manager and self.ws_manager.is_connected() else "[DISCONNECTED]"
-            print(f"\nWebSocket: {ws_status}")
+            # One vectorized RSI/volume pass over the batch, run inline
+            # so state is only written on the loop thread
+            candidates, advanced = self.signal_processor.screen_candidates(batch)
+            self.signal_processor.import_state(advanced)
+            self.logger.info(f"[*] {len(candidates)}/{len(batch)} closed candles passed screening")
             
-            # Print last few log messages
-            print("\nRecent Logs:")
-            print("-" * 50)
+            await asyncio.gather(
+                *(self.analyze_symbol(symbol, batch[symbol]) for symbol in candidates)
+            )
             
         except Exception as e:
-            self.logger.error(f"[-] Error updating display: {str(e)}")
+            self.logger.error(f"[-] Error analyzing closed candles: {str(e)}")
+
+    def _schedule(self, coro):
+        """Run coroutine in background without blocking the socket reader"""
+        task = asyncio.create_task(coro)
+        self._analysis_tasks.add(task)
+        task.add_done_callback(self._analysis_tasks.discard)
+
+    def _update_console(self, next_scan: datetime):
+        """Refresh console status"""
+        if self.console:
+            self.console.update(
+                scanning_mode="WATCHED PAIRS" if self.scanning_mode == SCAN_MODE_WATCHED else "ALL PAIRS",
+                total_pairs=len(self.watched_pairs if self.scanning_mode == SCAN_MODE_WATCHED else self.monitored_pairs),
+                watched_pairs=self.watched_pairs,
+                active_signals=self.active_signals,
+                next_scan=next_scan,
+                ws_connected=self.ws_manager.is_connected() if self.ws_manager else False,
+                user=self.user
+            )
+
     async def run(self):
         """Main bot loop"""
         try:
@@ -567,7 +1035,7 @@ class TradingBot:
 
             self.logger.info("[+] Bot started successfully")
             self.logger.info(f"[*] Monitoring {len(self.monitored_pairs)} pairs")
-            self.logger.info(f"[*] Current time (UTC): {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}")
+            self.logger.info(f"[*] Current time (UTC): {utc_now_str()}")
             self.logger.info(f"[*] User: {self.user}")
 
             # Send startup notification
@@ -575,48 +1043,77 @@ class TradingBot:
                 await self.telegram.send_message(
                     f"🤖 Bot started\n"
                     f"Monitoring {len(self.monitored_pairs)} pairs\n"
-                    f"Time: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC"
+                    f"Time: {utc_now_str()} UTC"
                 )
 
+            # Warm up rolling windows over REST, then follow closed candles
+            await self.scan_pairs()
+            self.start_kline_stream()
+            self._scan_trigger = asyncio.Event()
+            self._ticker_task = asyncio.create_task(self.stream_mini_tickers())
+            
+            # Ctrl+C / SIGTERM wake the wait below and exit through finally
+            if os.name != 'nt':
+                loop = asyncio.get_running_loop()
+                for sig in (SIGINT, SIGTERM):
+                    loop.add_signal_handler(sig, self.stop)
+
+            # Absolute monotonic deadlines: cycle work does not push the cadence back
+            scan_deadline = time.monotonic()
+            overruns = 0
+            
             while self._is_running:
                 try:
-                    # Calculate next scan time
-                    next_scan = datetime.utcnow()
-                    next_scan = next_scan.replace(
-                        second=0, 
-                        microsecond=0
-                    ) + timedelta(minutes=5)
-
-                    # Update console
-                    if self.console:
-                        self.console.update(
-                            scanning_mode="WATCHED PAIRS" if self.scanning_mode == SCAN_MODE_WATCHED else "ALL PAIRS",
-                            total_pairs=len(self.watched_pairs if self.scanning_mode == SCAN_MODE_WATCHED else self.monitored_pairs),
-                            watched_pairs=self.watched_pairs,
-                            active_signals=self.active_signals,
-                            next_scan=next_scan,
-                            ws_connected=self.ws_manager.is_connected() if self.ws_manager else False,
-                            user=self.user
-                        )
+                    scan_deadline += self.update_interval
+                    now = time.monotonic()
                     
-                    # Scan pairs
-                    await self.scan_pairs()
-                    
-                    # Wait for next update with console updates
-                    for _ in range(self.update_interval):
-                        if not self._is_running:
-                            break
-                        await asyncio.sleep(1)
-                        if self.console:
-                            self.console.update(
-                                scanning_mode="WATCHED PAIRS" if self.scanning_mode == SCAN_MODE_WATCHED else "ALL PAIRS",
-                                total_pairs=len(self.watched_pairs if self.scanning_mode == SCAN_MODE_WATCHED else self.monitored_pairs),
-                                watched_pairs=self.watched_pairs,
-                                active_signals=self.active_signals,
-                                next_scan=next_scan,
-                                ws_connected=self.ws_manager.is_connected() if self.ws_manager else False,
-                                user=self.user
+                    # Cycle ran past its slot: skip to the next one instead of
+                    # rescanning back to back
+                    if scan_deadline <= now:
+                        overruns += 1
+                        if overruns >= SCAN_OVERRUN_WARN:
+                            self.logger.warning(
+                                "[!] Scan cycles over the %ss interval %d times in a row",
+                                self.update_interval, overruns
+                            )
+                        scan_deadline += ((now - scan_deadline) // self.update_interval + 1) * self.update_interval
+                    else:
+                        overruns = 0
+                        
+                    # Wall clock only for display
+                    next_scan = datetime.now(timezone.utc) + timedelta(seconds=scan_deadline - now)
+
+                    # Wait for next check with console updates, waking
+                    # early for pairs whose price jumped or on stop()
+                    while self._is_running and time.monotonic() < scan_deadline:
+                        self._update_console(next_scan)
+                        try:
+                            await asyncio.wait_for(
+                                self._scan_trigger.wait(),
+                                timeout=min(1, scan_deadline - time.monotonic())
                             )
+                        except asyncio.TimeoutError:
+                            continue
+                        if self._is_running:
+                            await self.scan_moved_pairs()
+                    
+                    if not self._is_running:
+                        break
+                    
+                    # Re-filter pairs on fresh 24hr volume; pairs that drop out
+                    # stay on the stream but are no longer analyzed
+                    pairs = await self.get_valid_pairs()
+                    if pairs and set(pairs) != set(self.monitored_pairs):
+                        self.logger.info(f"[*] Pair universe changed: {len(pairs)} pairs")
+                        self.monitored_pairs = pairs
+                        if not set(pairs) <= self._stream_symbols:
+                            self.start_kline_stream()
+                    
+                    # Fall back to REST polling if the kline stream died
+                    if self._is_running and self._stream_task.done():
+                        self.logger.warning("[!] Kline stream stopped, rescanning over REST")
+                        await self.scan_pairs()
+                        self.start_kline_stream()
                     
                 except Exception as e:
                     self.logger.error(f"[-] Error in main loop: {str(e)}")
@@ -628,25 +1125,38 @@ class TradingBot:
             self.logger.error(f"[-] Fatal error: {str(e)}")
         finally:
             self._is_running = False
+            if self._stream_task:
+                self._stream_task.cancel()
+            if self._ticker_task:
+                self._ticker_task.cancel()
             if self.ws_manager:
                 await self.ws_manager.stop()
+            if self.telegram:
+                await self.telegram.close()
+            if self.state_store:
+                if self.signal_processor:
+                    self.state_store.save(self.signal_processor.export_state())
+                self.state_store.close()
+            if self._http:
+                await self._http.close()
             if self.console:
                 self.console.stop()
             self.logger.info("[*] Bot stopped")
 def main():
     """Main entry point"""
+    bot = None
+    
+    # libuv event loop (uvloop / winloop), selector policy as fallback
+    install_event_loop_policy()
+    
+    # Create and set event loop
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    
     try:
         # Create bot instance
         bot = TradingBot()
         
-        # Set event loop policy for Windows
-        if os.name == 'nt':
-            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-        
-        # Create and set event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
         # Run bot
         loop.run_until_complete(bot.run())
         
@@ -656,23 +1166,15 @@ def main():
         print(f"\n[ERROR] Fatal error: {str(e)}")
     finally:
         try:
-            loop = asyncio.get_event_loop()
-            
-            # Cancel pending tasks
-            tasks = [t for t in asyncio.all_tasks(loop) if not t.done()]
-            if tasks:
-                loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
-            
-            # Clean shutdown
-            loop.run_until_complete(loop.shutdown_asyncgens())
-            loop.close()
-            
+            shutdown_loop(loop)
         except Exception as e:
             print(f"\n[ERROR] Error during shutdown: {str(e)}")
         
         # Restore terminal
-        if 'bot' in locals() and bot.console:
+        if bot and bot.console:
             bot.console.stop()
+        if bot:
+            bot.stop_logging()
         
         # Wait for user input before exit on Windows
         if os.name == 'nt':
@@ -1,5 +1,5 @@
 ﻿import os
-import yaml
+from shared.config_loader import read_yaml
 
 def check_config():
     try:
@@ -14,8 +14,7 @@ def check_config():
             print(f"ERROR: Config file not found at: {config_path}")
             return
         
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        config = read_yaml(config_path)
             
         print("\nLoaded config:")
         print("="*50)
@@ -5,6 +5,7 @@ Contains the main trading logic and analysis components
 
 from datetime import datetime
 from typing import Dict, Any
+from shared.time_utils import utc_now_str
 
 # Core module information
 __version__ = "1.0.0"
@@ -35,7 +36,7 @@ def get_runtime_info() -> Dict[str, Any]:
     return {
         **RUNTIME_INFO,
         'uptime': (datetime.utcnow() - RUNTIME_INFO['start_time']).total_seconds(),
-        'current_time': datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+        'current_time': utc_now_str()
     }
 
 # Export core components
@@ -4,14 +4,15 @@ Futures market analyzer component
 
 import logging
 import asyncio
-from datetime import datetime
-from typing import Dict, Optional, List
-import numpy as np
-from binance import Client
+from typing import Dict, Optional, List, Union
+from binance import Client, AsyncClient
 from core.models import SignalData, VolumeZone
+from shared.klines import Klines
+from shared.time_utils import utc_now_str
+from shared.indicators_numba import rsi_sma, atr_sma, directional_strength
 
 class FuturesAnalyzer:
-    def __init__(self, client: Client, user_login: str = "", settings: Dict = None):
+    def __init__(self, client: Union[Client, AsyncClient], user_login: str = "", settings: Dict = None):
         """Initialize the analyzer"""
         self.client = client
         self.user_login = user_login
@@ -59,13 +60,13 @@ class FuturesAnalyzer:
         else:
             self.logger.info(log_message)
 
-    def quick_pre_filter(self, symbol: str) -> bool:
+    async def quick_pre_filter(self, symbol: str) -> bool:
         """Quick pre-filter check"""
         try:
             self.log(f"{symbol}: Quick pre-filter check...")
             
             # Get 24h ticker
-            ticker = self.client.futures_ticker(symbol=symbol)
+            ticker = await self._call('futures_ticker', symbol=symbol)
             volume_24h = float(ticker['volume']) * float(ticker['lastPrice'])
             
             if volume_24h < self.MIN_24H_VOLUME:
@@ -76,7 +77,7 @@ class FuturesAnalyzer:
                 return False
                 
             # Get order book
-            orderbook = self.client.futures_order_book(symbol=symbol, limit=5)
+            orderbook = await self._call('futures_order_book', symbol=symbol, limit=5)
             best_ask = float(orderbook['asks'][0][0])
             best_bid = float(orderbook['bids'][0][0])
             spread = (best_ask - best_bid) / best_bid
@@ -89,7 +90,7 @@ class FuturesAnalyzer:
                 return False
                 
             # Get funding rate
-            funding = self.client.futures_funding_rate(symbol=symbol, limit=1)
+            funding = await self._call('futures_funding_rate', symbol=symbol, limit=1)
             funding_rate = float(funding[0]['fundingRate'])
             
             if abs(funding_rate) > self.MAX_FUNDING_RATE:
@@ -111,11 +112,12 @@ class FuturesAnalyzer:
         try:
             self.log(f"{symbol}: Analyzing entry conditions...")
             
-            # Get data from multiple timeframes
+            # Get data from multiple timeframes and the order book at once
             tasks = [
                 self._get_klines(symbol, tf) for tf in self.TIMEFRAMES
             ]
-            klines_data = await asyncio.gather(*tasks)
+            tasks.append(self._get_orderbook(symbol))
+            *klines_data, orderbook = await asyncio.gather(*tasks)
             
             if not all(klines_data):
                 self.log(f"{symbol}: Failed to get klines data", "error")
@@ -130,10 +132,10 @@ class FuturesAnalyzer:
             ma50_15m = self._calculate_ma(klines_15m, 50)
             
             # Get current price
-            current_price = float(klines_5m[-1][4])
+            current_price = float(klines_5m.close[-1])
             
             # Calculate volume profile
-            volume_zones = self._analyze_volume_zones(symbol)
+            volume_zones = self._analyze_volume_zones(symbol, orderbook)
             if not volume_zones:
                 return None
                 
@@ -148,7 +150,8 @@ class FuturesAnalyzer:
                     entry_price=current_price,
                     rsi_5m=rsi_5m,
                     rsi_15m=rsi_15m,
-                    volume_zones=volume_zones
+                    volume_zones=volume_zones,
+                    klines=klines_5m
                 )
                 
             # Check SHORT conditions
@@ -162,7 +165,8 @@ class FuturesAnalyzer:
                     entry_price=current_price,
                     rsi_5m=rsi_5m,
                     rsi_15m=rsi_15m,
-                    volume_zones=volume_zones
+                    volume_zones=volume_zones,
+                    klines=klines_5m
                 )
                 
             return None
@@ -171,56 +175,61 @@ class FuturesAnalyzer:
             self.log(f"Error analyzing {symbol}: {str(e)}", "error")
             return None
 
-    async def _get_klines(self, symbol: str, interval: str) -> Optional[List]:
-        """Get klines data"""
+    async def _call(self, method: str, **params):
+        """Await an AsyncClient call, or run a blocking Client call on a worker thread"""
+        func = getattr(self.client, method)
+        if asyncio.iscoroutinefunction(func):
+            return await func(**params)
+        return await asyncio.to_thread(func, **params)
+
+    async def _get_klines(self, symbol: str, interval: str) -> Optional[Klines]:
+        """Get klines data as float64 arrays"""
         try:
-            return self.client.futures_klines(
+            rows = await self._call(
+                'futures_klines',
                 symbol=symbol,
                 interval=interval,
                 limit=100
             )
+            return Klines.from_rows(rows) if rows else None
         except Exception as e:
             self.log(f"Error getting klines for {symbol}: {str(e)}", "error")
             return None
 
-    def _calculate_rsi(self, klines: List, period: int = 14) -> float:
+    async def _get_orderbook(self, symbol: str) -> Optional[Dict]:
+        """Get order book used for volume zones"""
+        try:
+            return await self._call('futures_order_book', symbol=symbol, limit=100)
+        except Exception as e:
+            self.log(f"Error getting order book for {symbol}: {str(e)}", "error")
+            return None
+
+    def _calculate_rsi(self, klines: Klines, period: int = 14) -> float:
         """Calculate RSI"""
         try:
             if len(klines) < period + 1:
                 return 50
                 
-            closes = [float(k[4]) for k in klines]
-            deltas = np.diff(closes)
-            
-            gains = np.where(deltas > 0, deltas, 0)
-            losses = np.where(deltas < 0, -deltas, 0)
-            
-            avg_gain = np.mean(gains[-period:])
-            avg_loss = np.mean(losses[-period:])
-            
-            if avg_loss == 0:
-                return 100
-            
-            rs = avg_gain / avg_loss
-            return 100 - (100 / (1 + rs))
+            return rsi_sma(klines.close, period)
             
         except Exception:
             return 50
 
-    def _calculate_ma(self, klines: List, period: int) -> float:
+    def _calculate_ma(self, klines: Klines, period: int) -> float:
         """Calculate Moving Average"""
         try:
             if len(klines) < period:
                 return 0
-            closes = [float(k[4]) for k in klines[-period:]]
-            return sum(closes) / period
+            return float(klines.close[-period:].mean())
         except Exception:
             return 0
 
-    def _analyze_volume_zones(self, symbol: str) -> Dict[float, VolumeZone]:
+    def _analyze_volume_zones(self, symbol: str, orderbook: Optional[Dict]) -> Dict[float, VolumeZone]:
         """Analyze volume zones"""
         try:
-            orderbook = self.client.futures_order_book(symbol=symbol, limit=100)
+            if not orderbook:
+                return {}
+                
             zones = {}
             
             for price, qty in orderbook['asks']:
@@ -252,12 +261,13 @@ class FuturesAnalyzer:
         entry_price: float,
         rsi_5m: float,
         rsi_15m: float,
-        volume_zones: Dict[float, VolumeZone]
+        volume_zones: Dict[float, VolumeZone],
+        klines: Klines
     ) -> Optional[SignalData]:
         """Generate trading signal"""
         try:
             # Calculate ATR for stop loss and take profit
-            atr = self._calculate_atr(symbol)
+            atr = self._calculate_atr(klines)
             
             if signal_type == 'LONG':
                 stop_loss = entry_price * (1 - atr * 1.5)
@@ -299,7 +309,7 @@ class FuturesAnalyzer:
                 stop_loss=stop_loss,
                 take_profit=take_profit,
                 reason=reason,
-                timestamp=datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S'),
+                timestamp=utc_now_str(),
                 confidence=confidence
             )
 
@@ -307,26 +317,14 @@ class FuturesAnalyzer:
             self.log(f"Error generating signal for {symbol}: {str(e)}", "error")
             return None
 
-    def _calculate_atr(self, symbol: str, period: int = 14) -> float:
-        """Calculate ATR"""
+    def _calculate_atr(self, klines: Klines, period: int = 14) -> float:
+        """Calculate ATR from the primary timeframe klines already fetched"""
         try:
-            klines = self.client.futures_klines(
-                symbol=symbol,
-                interval=self.PRIMARY_TIMEFRAME,
-                limit=period + 1
-            )
-            
-            highs = [float(k[2]) for k in klines]
-            lows = [float(k[3]) for k in klines]
-            closes = [float(k[4]) for k in klines]
-            
-            tr = [max(highs[i] - lows[i],
-                     abs(highs[i] - closes[i-1]),
-                     abs(lows[i] - closes[i-1]))
-                  for i in range(1, len(klines))]
-                  
-            atr = sum(tr) / len(tr)
-            return atr / closes[-1]  # Return as percentage
+            if len(klines) < 2:
+                return 0.02
+                
+            atr = atr_sma(klines.high, klines.low, klines.close, period)
+            return atr / klines.close[-1]  # Return as percentage
             
         except Exception:
             return 0.02  # Default to 2%
@@ -368,63 +366,26 @@ class FuturesAnalyzer:
             
         except Exception:
             return 0.5
-    def _calculate_long_short_ratio(self, klines: List, lookback_period: int = 100) -> float:
+    def _calculate_long_short_ratio(self, klines: Klines, lookback_period: int = 100) -> float:
         """Calculate long/short volume ratio"""
         try:
             if len(klines) < lookback_period:
                 return 1.0
                 
-            long_volume = 0
-            short_volume = 0
+            volume = klines.volume[-lookback_period:]
+            bullish = klines.close[-lookback_period:] > klines.open[-lookback_period:]
             
-            for kline in klines[-lookback_period:]:
-                close = float(kline[4])
-                open = float(kline[1])
-                volume = float(kline[5])
-                
-                if close > open:
-                    long_volume += volume
-                else:
-                    short_volume += volume
-                    
-            return long_volume / (short_volume + 0.000001)
+            return float(volume[bullish].sum() / (volume[~bullish].sum() + 0.000001))
         except Exception:
             return 1.0
             
-    def _calculate_trend_strength(self, klines: List, period: int = 14) -> float:
+    def _calculate_trend_strength(self, klines: Klines, period: int = 14) -> float:
         """Calculate trend strength using ADX-like calculation"""
         try:
             if len(klines) < period + 1:
                 return 0.5
                 
-            highs = [float(k[2]) for k in klines]
-            lows = [float(k[3]) for k in klines]
-            closes = [float(k[4]) for k in klines]
-            
-            # Calculate +DI and -DI
-            plus_dm = [max(highs[i] - highs[i-1], 0) if highs[i] - highs[i-1] > lows[i-1] - lows[i] else 0 
-                      for i in range(1, len(klines))]
-            minus_dm = [max(lows[i-1] - lows[i], 0) if lows[i-1] - lows[i] > highs[i] - highs[i-1] else 0 
-                       for i in range(1, len(klines))]
-            
-            # Calculate True Range
-            tr = [max(highs[i] - lows[i],
-                     abs(highs[i] - closes[i-1]),
-                     abs(lows[i] - closes[i-1]))
-                  for i in range(1, len(klines))]
-            
-            # Calculate smoothed values
-            smoothed_plus_dm = np.mean(plus_dm[-period:])
-            smoothed_minus_dm = np.mean(minus_dm[-period:])
-            smoothed_tr = np.mean(tr[-period:])
-            
-            # Calculate directional indices
-            plus_di = 100 * smoothed_plus_dm / smoothed_tr if smoothed_tr > 0 else 0
-            minus_di = 100 * smoothed_minus_dm / smoothed_tr if smoothed_tr > 0 else 0
-            
-            # Calculate trend strength (simplified ADX)
-            dx = abs(plus_di - minus_di) / (plus_di + minus_di) * 100 if (plus_di + minus_di) > 0 else 0
-            return min(dx / 100, 1.0)  # Normalize to 0-1
+            return directional_strength(klines.high, klines.low, klines.close, period)
             
         except Exception:
             return 0.5
@@ -460,6 +421,9 @@ class FuturesAnalyzer:
                                    klines: List) -> float:
         """Calculate enhanced confidence score"""
         try:
+            if not isinstance(klines, Klines):
+                klines = Klines.from_rows(klines)
+                
             # Calculate base confidence
             base_confidence = self._calculate_signal_confidence(
                 signal_type,
@@ -507,7 +471,7 @@ class FuturesAnalyzer:
     def _log_confidence_components(self, components: Dict):
         """Log confidence score components for analysis"""
         try:
-            timestamp = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+            timestamp = utc_now_str()
             log_entry = f"[{timestamp}] Confidence components: {components}"
             
             # Add logging implementation here (e.g., to file or database)
@@ -4,13 +4,18 @@ Analyzes market trends and calculates trend confidence
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from binance import Client
 
+from shared.klines import Klines
 from ..models import MarketState, MarketTrend, VolumeZone
 from ..utils.calculations import calculate_delta, calculate_ma, calculate_rsi
 
+# Client is blocking: independent requests overlap on shared worker threads
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="MarketTrend")
+
 class MarketTrendAnalyzer:
     def __init__(self, 
                  api_key: str, 
@@ -42,11 +47,25 @@ class MarketTrendAnalyzer:
         # Setup logging
         self.logger = logging.getLogger(__name__)
 
+    def _fetch_concurrently(self, *calls: Tuple[Callable, Dict[str, Any]]) -> List[Any]:
+        """Run blocking client calls in parallel, results in call order"""
+        futures = [_executor.submit(method, **params) for method, params in calls]
+        return [future.result() for future in futures]
+
+    def _fetch_snapshot(self, kline_limit: int) -> Tuple[Dict, Dict, List, List]:
+        """Fetch ticker, orderbook and 5m/15m klines in one round trip"""
+        return self._fetch_concurrently(
+            (self.client.get_symbol_ticker, {'symbol': self.symbol}),
+            (self.client.get_order_book, {'symbol': self.symbol, 'limit': self.depth_limit}),
+            (self.client.get_klines, {'symbol': self.symbol, 'interval': '5m', 'limit': kline_limit}),
+            (self.client.get_klines, {'symbol': self.symbol, 'interval': '15m', 'limit': kline_limit})
+        )
+
     def get_order_book_state(self) -> Optional[MarketState]:
         """Get and analyze current orderbook state"""
         try:
-            # Get current price
-            ticker = self.client.get_symbol_ticker(symbol=self.symbol)
+            # Price, orderbook and klines requested together
+            ticker, depth, rows_5m, rows_15m = self._fetch_snapshot(200)
             current_price = float(ticker['price'])
             
             # Calculate price range
@@ -54,9 +73,6 @@ class MarketTrendAnalyzer:
             price_min = current_price - price_range
             price_max = current_price + price_range
             
-            # Get orderbook
-            depth = self.client.get_order_book(symbol=self.symbol, limit=self.depth_limit)
-            
             # Analyze bids and asks
             bids = [(float(p), float(q)) for p, q in depth['bids'] 
                     if price_min <= float(p) <= price_max]
@@ -73,9 +89,9 @@ class MarketTrendAnalyzer:
             cnt_ratio = bid_cnt / ask_cnt if ask_cnt else float('inf')
             spread = asks[0][0] - bids[0][0] if asks and bids else 0
             
-            # Get technical indicators
-            klines_5m = self.client.get_klines(symbol=self.symbol, interval='5m', limit=200)
-            klines_15m = self.client.get_klines(symbol=self.symbol, interval='15m', limit=200)
+            # Get technical indicators, converted once to float64 columns
+            klines_5m = Klines.from_rows(rows_5m)
+            klines_15m = Klines.from_rows(rows_15m)
             
             rsi_5m = calculate_rsi(klines_5m)
             ma20_5m = calculate_ma(klines_5m, 20)
@@ -119,8 +135,12 @@ class MarketTrendAnalyzer:
             vr, cr = state.vol_ratio, state.cnt_ratio
             
             # Get additional klines data
-            klines_5m = self.client.get_klines(symbol=self.symbol, interval='5m', limit=100)
-            klines_15m = self.client.get_klines(symbol=self.symbol, interval='15m', limit=100)
+            rows_5m, rows_15m = self._fetch_concurrently(
+                (self.client.get_klines, {'symbol': self.symbol, 'interval': '5m', 'limit': 100}),
+                (self.client.get_klines, {'symbol': self.symbol, 'interval': '15m', 'limit': 100})
+            )
+            klines_5m = Klines.from_rows(rows_5m)
+            klines_15m = Klines.from_rows(rows_15m)
             
             # Calculate indicators
             delta_5m = calculate_delta(klines_5m)
@@ -224,17 +244,10 @@ class MarketTrendAnalyzer:
     def get_market_state(self) -> MarketState:
         """Get current market state with enhanced metrics"""
         try:
-            # Get current price
-            ticker = self.client.get_symbol_ticker(symbol=self.symbol)
+            # Price, orderbook and klines for technical indicators
+            ticker, depth, rows_5m, rows_15m = self._fetch_snapshot(200)
             current_price = float(ticker['price'])
             
-            # Get orderbook
-            depth = self.client.get_order_book(symbol=self.symbol, limit=self.depth_limit)
-            
-            # Get klines for technical indicators
-            klines_5m = self.client.get_klines(symbol=self.symbol, interval='5m', limit=200)
-            klines_15m = self.client.get_klines(symbol=self.symbol, interval='15m', limit=200)
-            
             # Calculate basic metrics
             price_range = current_price * (self.price_range_percent / 100)
             price_min = current_price - price_range
@@ -254,7 +267,10 @@ class MarketTrendAnalyzer:
             cnt_ratio = bid_cnt / ask_cnt if ask_cnt else float('inf')
             spread = asks[0][0] - bids[0][0] if asks and bids else 0
             
-            # Calculate technical indicators
+            # Calculate technical indicators, converted once to float64 columns
+            klines_5m = Klines.from_rows(rows_5m)
+            klines_15m = Klines.from_rows(rows_15m)
+            
             rsi_5m = calculate_rsi(klines_5m)
             ma20_5m = calculate_ma(klines_5m, 20)
             ma50_15m = calculate_ma(klines_15m, 50)
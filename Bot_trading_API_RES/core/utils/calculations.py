@@ -4,16 +4,24 @@ Provides functions for market analysis and indicators
 """
 
 import numpy as np
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 from datetime import datetime
+from shared.klines import Klines
+from shared.indicators_numba import rsi_sma
 
-def calculate_delta(klines: List) -> float:
+KlineData = Union[List, Klines]
+
+def _as_klines(klines: KlineData) -> Klines:
+    """Convert raw kline rows to Klines, pass Klines through"""
+    return klines if isinstance(klines, Klines) else Klines.from_rows(klines)
+
+def calculate_delta(klines: KlineData) -> float:
     """
     Calculate delta (buy/sell volume ratio) from klines
     
     Parameters:
     -----------
-    klines : List
+    klines : List or Klines
         List of klines data from Binance API
         
     Returns:
@@ -22,11 +30,13 @@ def calculate_delta(klines: List) -> float:
         Delta value (-100 to 100)
     """
     try:
-        if not klines or len(klines) < 2:
+        if klines is None or len(klines) < 2:
             return 0
             
-        buy_volume = sum(float(k[5]) if float(k[4]) >= float(k[1]) else 0 for k in klines)
-        sell_volume = sum(float(k[5]) if float(k[4]) < float(k[1]) else 0 for k in klines)
+        klines = _as_klines(klines)
+        bullish = klines.close >= klines.open
+        buy_volume = float(klines.volume[bullish].sum())
+        sell_volume = float(klines.volume[~bullish].sum())
         
         total_volume = buy_volume + sell_volume
         return (buy_volume - sell_volume) / total_volume * 100 if total_volume > 0 else 0
@@ -34,13 +44,13 @@ def calculate_delta(klines: List) -> float:
     except Exception:
         return 0
 
-def calculate_ma(klines: List, period: int) -> float:
+def calculate_ma(klines: KlineData, period: int) -> float:
     """
     Calculate Moving Average
     
     Parameters:
     -----------
-    klines : List
+    klines : List or Klines
         List of klines data
     period : int
         MA period
@@ -53,18 +63,17 @@ def calculate_ma(klines: List, period: int) -> float:
     try:
         if len(klines) < period:
             return 0
-        closes = [float(k[4]) for k in klines[-period:]]
-        return sum(closes) / period
+        return float(_as_klines(klines).close[-period:].mean())
     except Exception:
         return 0
 
-def calculate_rsi(klines: List, period: int = 14) -> float:
+def calculate_rsi(klines: KlineData, period: int = 14) -> float:
     """
     Calculate Relative Strength Index
     
     Parameters:
     -----------
-    klines : List
+    klines : List or Klines
         List of klines data
     period : int
         RSI period (default: 14)
@@ -78,31 +87,19 @@ def calculate_rsi(klines: List, period: int = 14) -> float:
         if len(klines) < period + 1:
             return 50
             
-        closes = [float(k[4]) for k in klines]
-        deltas = np.diff(closes)
-        
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-        
-        avg_gain = np.mean(gains[-period:])
-        avg_loss = np.mean(losses[-period:])
-        
-        if avg_loss == 0:
-            return 100
-        
-        rs = avg_gain / avg_loss
-        return 100 - (100 / (1 + rs))
+        # One float64 array of closes, averaged in the compiled kernel
+        return float(rsi_sma(_as_klines(klines).close, period))
         
     except Exception:
         return 50
 
-def calculate_poc(timeframe_klines: List[List]) -> Optional[float]:
+def calculate_poc(timeframe_klines: List[KlineData]) -> Optional[float]:
     """
     Calculate Point of Control from multiple timeframe klines
     
     Parameters:
     -----------
-    timeframe_klines : List[List]
+    timeframe_klines : List[List] or List[Klines]
         List of klines data from multiple timeframes
         
     Returns:
@@ -111,18 +108,19 @@ def calculate_poc(timeframe_klines: List[List]) -> Optional[float]:
         POC price level
     """
     try:
-        all_prices = []
+        mid_prices = []
         for klines in timeframe_klines:
-            prices = [(float(k[2]) + float(k[3])) / 2 for k in klines]
-            all_prices.extend(prices)
+            if len(klines):
+                klines = _as_klines(klines)
+                mid_prices.append((klines.high + klines.low) / 2)
             
-        return float(np.median(all_prices)) if all_prices else None
+        return float(np.median(np.concatenate(mid_prices))) if mid_prices else None
         
     except Exception:
         return None
 
 def calculate_volume_profile(
-    klines: List,
+    klines: KlineData,
     price_levels: int = 100,
     volume_threshold: float = 0.1
 ) -> Dict[float, float]:
@@ -131,7 +129,7 @@ def calculate_volume_profile(
     
     Parameters:
     -----------
-    klines : List
+    klines : List or Klines
         List of klines data
     price_levels : int
         Number of price levels to analyze
@@ -144,35 +142,41 @@ def calculate_volume_profile(
         Price levels and their volume
     """
     try:
-        if not klines:
+        if klines is None or len(klines) == 0:
             return {}
             
         # Extract prices and volumes
-        prices = [(float(k[2]) + float(k[3])) / 2 for k in klines]
-        volumes = [float(k[5]) for k in klines]
+        klines = _as_klines(klines)
+        prices = (klines.high + klines.low) / 2
         
         # Create price levels
-        min_price = min(prices)
-        max_price = max(prices)
+        min_price = float(prices.min())
+        max_price = float(prices.max())
         level_size = (max_price - min_price) / price_levels
+        if level_size == 0:
+            return {}
         
-        # Calculate volume for each level
-        profile = {}
-        for price, volume in zip(prices, volumes):
-            level = min_price + level_size * int((price - min_price) / level_size)
-            profile[level] = profile.get(level, 0) + volume
+        # Sum volume per level index in one pass
+        indexes, inverse = np.unique(
+            ((prices - min_price) / level_size).astype(np.int64),
+            return_inverse=True
+        )
+        volumes = np.bincount(inverse.ravel(), weights=klines.volume)
             
         # Filter by threshold
-        total_volume = sum(profile.values())
-        threshold_volume = total_volume * volume_threshold
+        threshold_volume = volumes.sum() * volume_threshold
         
-        return {k: v for k, v in profile.items() if v >= threshold_volume}
+        return {
+            min_price + level_size * int(index): float(volume)
+            for index, volume in zip(indexes, volumes)
+            if volume >= threshold_volume
+        }
         
     except Exception:
         return {}
 
 def calculate_support_resistance(
-    klines: List,
+    klines: KlineData,
     num_levels: int = 5,
     window_size: int = 20
 ) -> Tuple[List[float], List[float]]:
@@ -181,7 +185,7 @@ def calculate_support_resistance(
     
     Parameters:
     -----------
-    klines : List
+    klines : List or Klines
         List of klines data
     num_levels : int
         Number of levels to identify
@@ -197,25 +201,25 @@ def calculate_support_resistance(
         if len(klines) < window_size:
             return [], []
             
-        highs = [float(k[2]) for k in klines]
-        lows = [float(k[3]) for k in klines]
+        klines = _as_klines(klines)
+        count = len(klines) - 2 * window_size
+        if count <= 0:
+            return [], []
         
-        resistance_levels = []
-        support_levels = []
+        # Find peaks and troughs: candle i against the window [i - w, i + w)
+        highs = klines.high
+        lows = klines.low
+        high_windows = np.lib.stride_tricks.sliding_window_view(highs, 2 * window_size)[:count]
+        low_windows = np.lib.stride_tricks.sliding_window_view(lows, 2 * window_size)[:count]
+        centre_highs = highs[window_size:window_size + count]
+        centre_lows = lows[window_size:window_size + count]
         
-        # Find peaks and troughs
-        for i in range(window_size, len(klines) - window_size):
-            window_highs = highs[i-window_size:i+window_size]
-            window_lows = lows[i-window_size:i+window_size]
-            
-            if highs[i] == max(window_highs):
-                resistance_levels.append(highs[i])
-            if lows[i] == min(window_lows):
-                support_levels.append(lows[i])
+        resistance_levels = np.unique(centre_highs[centre_highs == high_windows.max(axis=1)])
+        support_levels = np.unique(centre_lows[centre_lows == low_windows.min(axis=1)])
                 
         # Sort and get top levels
-        resistance_levels = sorted(set(resistance_levels), reverse=True)[:num_levels]
-        support_levels = sorted(set(support_levels))[:num_levels]
+        resistance_levels = resistance_levels[::-1][:num_levels].tolist()
+        support_levels = support_levels[:num_levels].tolist()
         
         return support_levels, resistance_levels
         
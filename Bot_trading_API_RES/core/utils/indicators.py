@@ -4,6 +4,8 @@ Technical indicators calculation module
 
 from typing import List, Dict, Optional
 import numpy as np
+from shared.indicators_numba import rsi_sma
+from .calculations import KlineData, _as_klines
 
 def calculate_rsi(closes: List[float], period: int = 14) -> float:
     """
@@ -25,31 +27,18 @@ def calculate_rsi(closes: List[float], period: int = 14) -> float:
         if len(closes) < period + 1:
             return 50.0
 
-        deltas = np.diff(closes)
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-        
-        avg_gain = np.mean(gains[-period:])
-        avg_loss = np.mean(losses[-period:])
-        
-        if avg_loss == 0:
-            return 100.0
-        
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        return float(rsi)
+        return float(rsi_sma(np.asarray(closes, dtype=np.float64), period))
         
     except Exception:
         return 50.0
 
-def calculate_ma(klines: List, period: int) -> float:
+def calculate_ma(klines: KlineData, period: int) -> float:
     """
     Calculate Moving Average
     
     Parameters:
     -----------
-    klines : List
+    klines : List or Klines
         List of klines data
     period : int
         MA period
@@ -62,18 +51,17 @@ def calculate_ma(klines: List, period: int) -> float:
     try:
         if len(klines) < period:
             return 0
-        closes = [float(k[4]) for k in klines[-period:]]
-        return sum(closes) / period
+        return float(_as_klines(klines).close[-period:].mean())
     except Exception:
         return 0
 
-def calculate_delta(klines: List) -> float:
+def calculate_delta(klines: KlineData) -> float:
     """
     Calculate volume delta
     
     Parameters:
     -----------
-    klines : List
+    klines : List or Klines
         List of klines data
         
     Returns:
@@ -82,11 +70,13 @@ def calculate_delta(klines: List) -> float:
         Delta percentage
     """
     try:
-        if not klines or len(klines) < 2:
+        if klines is None or len(klines) < 2:
             return 0
                 
-        buy_volume = sum(float(k[5]) if float(k[4]) >= float(k[1]) else 0 for k in klines)
-        sell_volume = sum(float(k[5]) if float(k[4]) < float(k[1]) else 0 for k in klines)
+        klines = _as_klines(klines)
+        bullish = klines.close >= klines.open
+        buy_volume = float(klines.volume[bullish].sum())
+        sell_volume = float(klines.volume[~bullish].sum())
         
         total_volume = buy_volume + sell_volume
         return (buy_volume - sell_volume) / total_volume * 100 if total_volume > 0 else 0
@@ -94,13 +84,13 @@ def calculate_delta(klines: List) -> float:
     except Exception:
         return 0
 
-def calculate_poc(timeframe_klines: List[List]) -> Optional[float]:
+def calculate_poc(timeframe_klines: List[KlineData]) -> Optional[float]:
     """
     Calculate Point of Control
     
     Parameters:
     -----------
-    timeframe_klines : List[List]
+    timeframe_klines : List[List] or List[Klines]
         List of klines data from multiple timeframes
         
     Returns:
@@ -109,23 +99,24 @@ def calculate_poc(timeframe_klines: List[List]) -> Optional[float]:
         POC value
     """
     try:
-        all_prices = []
+        mid_prices = []
         for klines in timeframe_klines:
-            prices = [(float(k[2]) + float(k[3])) / 2 for k in klines]
-            all_prices.extend(prices)
+            if len(klines):
+                klines = _as_klines(klines)
+                mid_prices.append((klines.high + klines.low) / 2)
             
-        return float(np.median(all_prices)) if all_prices else None
+        return float(np.median(np.concatenate(mid_prices))) if mid_prices else None
         
     except Exception:
         return None
 
-def calculate_volume_profile(klines: List) -> Dict:
+def calculate_volume_profile(klines: KlineData) -> Dict:
     """
     Calculate volume profile
     
     Parameters:
     -----------
-    klines : List
+    klines : List or Klines
         List of klines data
         
     Returns:
@@ -134,20 +125,25 @@ def calculate_volume_profile(klines: List) -> Dict:
         Volume profile data
     """
     try:
-        prices = [float(k[4]) for k in klines]  # Close prices
-        volumes = [float(k[5]) for k in klines]  # Volumes
+        klines = _as_klines(klines)
+        prices = klines.close
+        volumes = klines.volume
+        total_volume = float(volumes.sum())
         
-        return {
-            "price_levels": prices,
-            "volumes": volumes,
-            "total_volume": sum(volumes),
-            "vwap": sum(p * v for p, v in zip(prices, volumes)) / sum(volumes)
-        }
+        if total_volume > 0:
+            return {
+                "price_levels": prices.tolist(),
+                "volumes": volumes.tolist(),
+                "total_volume": total_volume,
+                "vwap": float(np.dot(prices, volumes)) / total_volume
+            }
         
     except Exception:
-        return {
-            "price_levels": [],
-            "volumes": [],
-            "total_volume": 0,
-            "vwap": 0
-        }
+        pass
+        
+    return {
+        "price_levels": [],
+        "volumes": [],
+        "total_volume": 0,
+        "vwap": 0
+    }
@@ -12,24 +12,27 @@ import os
 import sys
 import asyncio
 import logging
-from datetime import datetime
+from logging.handlers import TimedRotatingFileHandler
 from typing import Dict, Any, List, Optional
-import yaml
 
 from shared.constants import *
+from shared.event_loop import install_event_loop_policy, shutdown_loop
+from shared.log_queue import start_queue_logging
 from shared.telegram_service import TelegramService
+from shared.time_utils import utc_now_str
 from shared.websocket_manager import WebSocketManager, MessageType
 
 class OrderManager:
     def __init__(self):
         """Initialize Order Manager"""
+        self.user = BOT_USER
+        self._log_listener = None
         self.logger = self._setup_logging()
         self.telegram = None
         self.ws_manager = None
         self._is_running = True
         self.active_signals: Dict[str, Dict] = {}
         self.watched_pairs: List[str] = []
-        self.user = "Anhbaza01"
 
     def _setup_logging(self) -> logging.Logger:
         """Setup logging configuration"""
@@ -38,20 +41,21 @@ class OrderManager:
             logs_dir = os.path.join(current_dir, 'logs')
             os.makedirs(logs_dir, exist_ok=True)
             
-            log_filename = os.path.join(
-                logs_dir, 
-                f'order_manager_{datetime.utcnow().strftime("%Y%m%d")}.log'
-            )
+            # One file per UTC day, rotated at midnight, two weeks kept
+            log_filename = os.path.join(logs_dir, 'order_manager.log')
             
-            logging.basicConfig(
-                level=logging.INFO,
-                format='%(asctime)s UTC | %(levelname)s | %(message)s',
-                handlers=[
-                    logging.FileHandler(log_filename),
-                    logging.StreamHandler(sys.stdout)
-                ],
-                datefmt='%Y-%m-%d %H:%M:%S'
+            # File and console writes happen on the listener thread
+            queue_handler, self._log_listener = start_queue_logging(
+                TimedRotatingFileHandler(
+                    log_filename,
+                    when='midnight',
+                    utc=True,
+                    backupCount=14,
+                    encoding='utf-8'
+                ),
+                logging.StreamHandler(sys.stdout)
             )
+            logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
             
             logger = logging.getLogger("OrderManager")
             
@@ -59,7 +63,7 @@ class OrderManager:
             logger.info("Order Manager - Logging Initialized")
             logger.info(f"Log Level: {logging.getLevelName(logger.getEffectiveLevel())}")
             logger.info(f"Log File: {log_filename}")
-            logger.info(f"Current Time (UTC): {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}")
+            logger.info(f"Current Time (UTC): {utc_now_str()}")
             logger.info(f"User: {self.user}")
             logger.info("="*50)
             
@@ -75,6 +79,12 @@ class OrderManager:
             )
             return logging.getLogger("OrderManager")
 
+    def stop_logging(self):
+        """Flush queued log records and stop the listener thread"""
+        if self._log_listener:
+            self._log_listener.stop()
+            self._log_listener = None
+
     async def handle_new_signal(self, data: Dict[str, Any]):
         """Handle new trading signal"""
         try:
@@ -185,7 +195,7 @@ class OrderManager:
             
             # Print header
             print("\n=== Order Manager ===")
-            print(f"Time (UTC): {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}")
+            print(f"Time (UTC): {utc_now_str()}")
             print(f"Active Signals: {len(self.active_signals)}")
             print(f"Watched Pairs: {len(self.watched_pairs)}")
             print("="*20)
@@ -194,11 +204,12 @@ class OrderManager:
             if self.active_signals:
                 print("\nActive Signals:")
                 for signal in self.active_signals.values():
+                    decimals = signal.get('decimals', 2)
                     print(
                         f"\n{signal['symbol']} - {signal['type']}\n"
-                        f"Entry: {signal['entry']:.2f}\n"
-                        f"TP: {signal['tp']:.2f}\n"
-                        f"SL: {signal['sl']:.2f}\n"
+                        f"Entry: {signal['entry']:.{decimals}f}\n"
+                        f"TP: {signal['tp']:.{decimals}f}\n"
+                        f"SL: {signal['sl']:.{decimals}f}\n"
                         f"Confidence: {signal.get('confidence', 0)}%"
                     )
             else:
@@ -269,7 +280,7 @@ class OrderManager:
                 return
 
             self.logger.info("[+] Order Manager started successfully")
-            self.logger.info(f"[*] Current time (UTC): {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}")
+            self.logger.info(f"[*] Current time (UTC): {utc_now_str()}")
 
             while self._is_running:
                 try:
@@ -295,18 +306,19 @@ class OrderManager:
 
 def main():
     """Main entry point"""
+    # libuv event loop (uvloop / winloop), selector policy as fallback
+    install_event_loop_policy()
+    
+    # Create and set event loop
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    
+    manager = None
+    
     try:
         # Create manager instance
         manager = OrderManager()
         
-        # Set event loop policy for Windows
-        if os.name == 'nt':
-            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-        
-        # Create and set event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
         # Run manager
         loop.run_until_complete(manager.run())
         
@@ -316,18 +328,12 @@ def main():
         print(f"\n[ERROR] Fatal error: {str(e)}")
     finally:
         try:
-            loop = asyncio.get_event_loop()
-            
-            # Cancel pending tasks
-            tasks = [t for t in asyncio.all_tasks(loop) if not t.done()]
-            if tasks:
-                loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
-            
-            # Clean shutdown
-            loop.run_until_complete(loop.shutdown_asyncgens())
-            
-        finally:
-            loop.close()
+            shutdown_loop(loop)
+        except Exception as e:
+            print(f"\n[ERROR] Error during shutdown: {str(e)}")
+        
+        if manager:
+            manager.stop_logging()
             
         # Wait for user input before exit on Windows
         if os.name == 'nt':
@@ -7,9 +7,12 @@ Last Updated: 2025-05-23 10:57:53
 import tkinter as tk
 from tkinter import ttk, messagebox
 import asyncio
+import logging
 from typing import Dict, Any, Callable
 from datetime import datetime
-from decimal import Decimal
+from shared.constants import BOT_USER
+
+logger = logging.getLogger(__name__)
 
 class OrderWindow:
     def __init__(
@@ -20,18 +23,17 @@ class OrderWindow:
     ):
         """Initialize order management window"""
         self.window = tk.Tk()
-        self.window.title("Quản lý Lệnh Giao dịch - Anhbaza01")
+        self.window.title(f"Quản lý Lệnh Giao dịch - {BOT_USER}")
         self.window.geometry("1200x800")
         
-        # Print debug message
-        print("\n[DEBUG] GUI window initialized")
+        logger.debug("GUI window initialized")
         
         self.max_orders = max_orders
         self.on_signal_confirm = on_signal_confirm
         self.update_interval = update_interval
         
         self._setup_gui()
-        print("\n[DEBUG] GUI setup completed")
+        logger.debug("GUI setup completed")
 
 
     def _setup_gui(self):
@@ -189,7 +191,7 @@ class OrderWindow:
     def update_signals(self, signals: Dict[str, Dict[str, Any]]):
         """Update signals display"""
         try:
-            print(f"\n[DEBUG] Updating signals in GUI: {signals}")
+            logger.debug("Updating signals in GUI: %s", signals)
             
             # Add or update signals
             for symbol, data in signals.items():
@@ -206,13 +208,13 @@ class OrderWindow:
                     
                     # Always insert as new
                     self.signals_tree.insert("", "end", values=values)
-                    print(f"\n[DEBUG] Added signal for {symbol}")
+                    logger.debug("Added signal for %s", symbol)
                     
                 except Exception as e:
-                    print(f"\n[DEBUG] Error processing signal {symbol}: {str(e)}")
+                    logger.error("Error processing signal %s: %s", symbol, e, exc_info=True)
                     
         except Exception as e:
-            print(f"\n[DEBUG] Error in update_signals: {str(e)}")
+            logger.error("Error in update_signals: %s", e, exc_info=True)
 
     def update_orders(self, orders: Dict[str, Any], stats: Dict[str, Any]):
         """Update orders display and statistics"""
@@ -5,6 +5,8 @@ Last Updated: 2025-05-23 11:08:59
 """
 
 import logging
+import orjson
+from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Dict, Any, Optional, Callable
 from shared.constants import (
@@ -40,55 +42,50 @@ class TelegramHandler:
         self.on_signal_received = on_signal_received
         self.on_order_update = on_order_update
 
-    aasync def handle_message(self, message: str) -> None:
-     """Handle incoming Telegram message"""
-     try:
-        print(f"\n[DEBUG] TelegramHandler received message: {message}")
-        
-        # Try to parse as command first
-        if message.startswith("CMD:"):
-            try:
-                json_str = message[4:].strip()
-                print(f"\n[DEBUG] Parsing command JSON: {json_str}")
-                
-                command = json.loads(json_str)
-                if command.get("type") == "SIGNAL":
-                    signal_data = command.get("data", {})
-                    print(f"\n[DEBUG] Found signal data: {signal_data}")
-                    
-                    # Format signal for GUI
-                    formatted_signal = {
-                        "symbol": signal_data["symbol"],
-                        "signal_type": signal_data["signal_type"],
-                        "entry": float(signal_data["entry"]),
-                        "take_profit": float(signal_data["take_profit"]),
-                        "stop_loss": float(signal_data["stop_loss"]),
-                        "confidence": float(signal_data.get("confidence", 0.55)),
-                        "timestamp": datetime.utcnow().strftime('%H:%M:%S')
-                    }
-                    
-                    print(f"\n[DEBUG] Formatted signal: {formatted_signal}")
+    async def handle_message(self, message: str) -> None:
+        """Handle incoming Telegram message"""
+        try:
+            self.logger.debug("TelegramHandler received message: %s", message)
+            
+            # Try to parse as command first
+            if message.startswith("CMD:"):
+                try:
+                    json_str = message[4:].strip()
+                    self.logger.debug("Parsing command JSON: %s", json_str)
                     
-                    # Send to GUI
-                    if self.on_signal_received:
-                        print("\n[DEBUG] Sending signal to GUI...")
-                        self.on_signal_received(formatted_signal)
-                        print("\n[DEBUG] Signal sent to GUI")
-                    else:
-                        print("\n[DEBUG] No signal callback registered!")
+                    command = orjson.loads(json_str)
+                    if command.get("type") == "SIGNAL":
+                        signal_data = command.get("data", {})
+                        self.logger.debug("Found signal data: %s", signal_data)
                         
-            except json.JSONDecodeError as e:
-                print(f"\n[DEBUG] JSON parse error: {str(e)}")
-                print(f"\n[DEBUG] Raw message was: {message}")
-        
-        # Also check for regular messages containing signal data
-        else:
-            print(f"\n[DEBUG] Regular message received: {message}")
-            # Rest of your regular message handling code...
+                        # Format signal for GUI
+                        formatted_signal = {
+                            "symbol": signal_data["symbol"],
+                            "signal_type": signal_data["signal_type"],
+                            "entry": float(signal_data["entry"]),
+                            "take_profit": float(signal_data["take_profit"]),
+                            "stop_loss": float(signal_data["stop_loss"]),
+                            "confidence": float(signal_data.get("confidence", 0.55)),
+                            "timestamp": datetime.now(timezone.utc).strftime('%H:%M:%S')
+                        }
+                        
+                        self.logger.debug("Formatted signal: %s", formatted_signal)
+                        
+                        # Send to GUI
+                        if self.on_signal_received:
+                            self.on_signal_received(formatted_signal)
+                        else:
+                            self.logger.warning("No signal callback registered")
+                            
+                except orjson.JSONDecodeError as e:
+                    self.logger.error("JSON parse error: %s (raw message: %s)", e, message)
             
-     except Exception as e:
-        print(f"\n[DEBUG] Error in handle_message: {str(e)}")
-        print(f"\n[DEBUG] Message was: {message}")
+            # Also check for regular messages containing signal data
+            else:
+                self.logger.debug("Regular message received: %s", message)
+                
+        except Exception as e:
+            self.logger.error("Error in handle_message: %s (message: %s)", e, message, exc_info=True)
 
     async def _process_command(self, command: Dict[str, Any]) -> None:
         """
@@ -130,7 +127,7 @@ class TelegramHandler:
                 'entry': float(data['entry']),
                 'take_profit': float(data['take_profit']),
                 'stop_loss': float(data['stop_loss']),
-                'timestamp': datetime.utcnow().strftime('%H:%M:%S'),
+                'timestamp': datetime.now(timezone.utc).strftime('%H:%M:%S'),
                 'confidence': data.get('confidence', 0.55)
             }
 
@@ -3,12 +3,22 @@ Binance API client service for Bot Trading API REST
 Handles all interactions with Binance's API
 """
 
-import asyncio
 import logging
+import aiohttp
 from typing import Dict, List, Optional, Any
-from datetime import datetime
-from binance import Client, AsyncClient
+from binance import AsyncClient
 from binance.exceptions import BinanceAPIException
+from shared.cache import ttl_cache
+from shared.rate_limiter import WeightLimiter
+from shared.symbols import usdt_trading_symbols
+from shared.constants import (
+    PAIRS_CACHE_TTL,
+    FUTURES_WEIGHT_LIMIT,
+    HTTP_POOL_LIMIT,
+    HTTP_POOL_LIMIT_PER_HOST,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_DNS_CACHE_TTL
+)
 
 class BinanceClient:
     def __init__(self, api_key: str = "", api_secret: str = ""):
@@ -24,10 +34,10 @@ class BinanceClient:
         """
         self.api_key = api_key
         self.api_secret = api_secret
-        self.client = Client(api_key, api_secret)
+        # REST calls all go through the async client, nothing blocks the loop
+        self.async_client: Optional[AsyncClient] = None
         self.logger = logging.getLogger(__name__)
-        self.last_api_call = datetime.utcnow()
-        self.RATE_LIMIT_DELAY = 0.1  # seconds between API calls
+        self._weights: Optional[WeightLimiter] = None
 
       # Add health check method
     async def check_health(self) -> bool:
@@ -40,38 +50,78 @@ class BinanceClient:
             self.logger.error(f"Health check failed: {str(e)}")
             return False
     async def initialize_async_client(self):
-        """Initialize async client"""
-        self.async_client = await AsyncClient.create(self.api_key, self.api_secret)
+        """Initialize async client on a pooled keep-alive connection"""
+        self._weights = WeightLimiter(FUTURES_WEIGHT_LIMIT)
+        
+        # One TLS handshake per pooled connection instead of per request
+        self.async_client = await AsyncClient.create(
+            self.api_key,
+            self.api_secret,
+            session_params={
+                'connector': aiohttp.TCPConnector(
+                    limit=HTTP_POOL_LIMIT,
+                    limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+                    ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+                    keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT
+                )
+            }
+        )
 
     async def close_async_client(self):
         """Close async client"""
         await self.async_client.close_connection()
 
-    async def _handle_rate_limit(self):
-        """Handle API rate limiting"""
-        now = datetime.utcnow()
-        elapsed = (now - self.last_api_call).total_seconds()
-        if elapsed < self.RATE_LIMIT_DELAY:
-            await asyncio.sleep(self.RATE_LIMIT_DELAY - elapsed)
-        self.last_api_call = now
+    async def _handle_rate_limit(self, weight: int = 1):
+        """Wait only when the per-minute request weight budget is spent"""
+        await self._weights.acquire(weight)
+
+    @staticmethod
+    def _klines_weight(limit: int) -> int:
+        """Request weight of a futures klines call"""
+        if limit < 100:
+            return 1
+        if limit < 500:
+            return 2
+        return 5 if limit <= 1000 else 10
+
+    @staticmethod
+    def _orderbook_weight(limit: int) -> int:
+        """Request weight of a futures order book call"""
+        if limit <= 50:
+            return 2
+        if limit <= 100:
+            return 5
+        return 10 if limit <= 500 else 20
 
-    async def get_futures_symbols(self) -> List[str]:
+    async def get_futures_symbols(self, usdt_only: bool = False) -> List[str]:
         """
         Get list of available futures symbols
         
+        Parameters:
+        -----------
+        usdt_only : bool
+            Only USDT-quoted coin contracts
+            
         Returns:
         --------
         List[str]
             List of trading symbols
         """
         try:
-            await self._handle_rate_limit()
-            exchange_info = await self.async_client.futures_exchange_info()
+            exchange_info = await self._fetch_exchange_info()
+            if usdt_only:
+                return usdt_trading_symbols(exchange_info)
             return [s['symbol'] for s in exchange_info['symbols'] if s['status'] == 'TRADING']
         except Exception as e:
             self.logger.error(f"Error getting futures symbols: {str(e)}")
             return []
 
+    @ttl_cache(ttl=PAIRS_CACHE_TTL)
+    async def _fetch_exchange_info(self) -> Dict:
+        """Fetch futures exchange info, cached since the universe rarely changes"""
+        await self._handle_rate_limit()
+        return await self.async_client.futures_exchange_info()
+
     async def get_futures_klines(
         self,
         symbol: str,
@@ -96,7 +146,7 @@ class BinanceClient:
             Klines data
         """
         try:
-            await self._handle_rate_limit()
+            await self._handle_rate_limit(self._klines_weight(limit))
             return await self.async_client.futures_klines(
                 symbol=symbol,
                 interval=interval,
@@ -127,7 +177,7 @@ class BinanceClient:
             Order book data
         """
         try:
-            await self._handle_rate_limit()
+            await self._handle_rate_limit(self._orderbook_weight(limit))
             return await self.async_client.futures_order_book(
                 symbol=symbol,
                 limit=limit
@@ -208,7 +258,7 @@ class BinanceClient:
             Position information
         """
         try:
-            await self._handle_rate_limit()
+            await self._handle_rate_limit(5)
             positions = await self.async_client.futures_position_information(symbol=symbol)
             return positions[0] if positions else {}
         except Exception as e:
@@ -225,7 +275,7 @@ class BinanceClient:
             Account information
         """
         try:
-            await self._handle_rate_limit()
+            await self._handle_rate_limit(5)
             return await self.async_client.futures_account()
         except Exception as e:
             self.logger.error(f"Error getting futures account: {str(e)}")
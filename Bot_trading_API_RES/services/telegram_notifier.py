@@ -2,14 +2,15 @@
 Telegram notification service
 """
 
+import time
 import logging
 import asyncio
-from datetime import datetime
 from typing import Optional
 from telegram import Bot
 from telegram.constants import ParseMode
 from telegram.error import TelegramError
 import telegram
+from shared.constants import TELEGRAM_QUEUE_MAX
 
 class TelegramNotifier:
     def __init__(self, token: str = "", chat_id: str = ""):
@@ -29,10 +30,11 @@ class TelegramNotifier:
         self.chat_id = chat_id
         self.bot: Optional[Bot] = None
         self.logger = logging.getLogger(__name__)
-        self.message_queue = asyncio.Queue()
-        self.is_running = False
-        self.last_message_time = datetime.utcnow()
         self.MESSAGE_RATE_LIMIT = 1.0  # Minimum seconds between messages
+        self.message_queue = asyncio.Queue(maxsize=TELEGRAM_QUEUE_MAX)
+        self._worker: Optional[asyncio.Task] = None
+        self.is_running = False
+        self.last_message_time = time.monotonic()
         
     async def start(self):
         """Start the notification service"""
@@ -55,6 +57,9 @@ class TelegramNotifier:
                 self.logger.error(f"Error getting chat: {str(e)}")
                 raise
                 
+            # Signals are sent from the queue, off the caller's path
+            self._worker = asyncio.create_task(self._drain_queue())
+            
             self.logger.info("Telegram notification service started successfully")
             
         except Exception as e:
@@ -66,13 +71,19 @@ class TelegramNotifier:
         """Stop the notification service"""
         try:
             self.logger.info("Stopping Telegram notification service...")
-            self.is_running = False
-            # Empty the message queue
-            while not self.message_queue.empty():
+            
+            # Deliver queued signals before going offline
+            if self._worker:
                 try:
-                    self.message_queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    break
+                    await asyncio.wait_for(self.message_queue.join(), timeout=10)
+                except asyncio.TimeoutError:
+                    self.logger.warning(
+                        f"Dropped {self.message_queue.qsize()} queued signals on shutdown"
+                    )
+                self._worker.cancel()
+                self._worker = None
+                
+            self.is_running = False
             self.logger.info("Telegram notification service stopped")
         except Exception as e:
             self.logger.error(f"Error stopping Telegram service: {str(e)}")
@@ -120,7 +131,7 @@ class TelegramNotifier:
             return False
 
     async def send_signal(self, signal_data) -> bool:
-        """Send trading signal
+        """Queue trading signal for the background sender
         
         Parameters
         ----------
@@ -130,7 +141,7 @@ class TelegramNotifier:
         Returns
         -------
         bool
-            True if signal was sent successfully
+            True if signal was queued
         """
         try:
             message = (
@@ -144,17 +155,30 @@ class TelegramNotifier:
                 f"⏰ Time: {signal_data.timestamp}"
             )
             
-            return await self.send_message(message)
+            self.message_queue.put_nowait(message)
+            return True
             
+        except asyncio.QueueFull:
+            self.logger.warning(f"Signal queue full, dropping {signal_data.symbol} signal")
+            return False
         except Exception as e:
             self.logger.error(f"Error sending signal: {str(e)}")
             return False
 
+    async def _drain_queue(self):
+        """Send queued signals one by one at Telegram's pace"""
+        while True:
+            message = await self.message_queue.get()
+            try:
+                await self.send_message(message)
+            finally:
+                self.message_queue.task_done()
+
     async def _handle_rate_limit(self):
         """Handle message rate limiting"""
-        now = datetime.utcnow()
-        elapsed = (now - self.last_message_time).total_seconds()
+        elapsed = time.monotonic() - self.last_message_time
         if elapsed < self.MESSAGE_RATE_LIMIT:
             delay = self.MESSAGE_RATE_LIMIT - elapsed
             await asyncio.sleep(delay)
-        self.last_message_time = now
\ No newline at end of file
+        # Next send is due one interval after this one actually goes out
+        self.last_message_time = time.monotonic()
\ No newline at end of file
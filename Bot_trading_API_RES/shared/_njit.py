@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Optional Numba Support
+Author: Anhbaza01
+Version: 1.0.0
+Last Updated: 2026-10-16 13:02:55 UTC
+
+Re-exports numba's njit/prange, or no-op stand-ins when numba is not
+installed so kernels still run as plain Python
+"""
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Return the function unchanged (bare @njit or @njit(...))"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Cache Utilities
+Author: Anhbaza01
+Version: 1.0.0
+Last Updated: 2026-10-16 09:12:40 UTC
+
+Time-based memoization for slow-changing exchange data
+(exchange info, trading pair universe) and expiring sets for
+suppressing repeated events
+"""
+
+import time
+import asyncio
+import functools
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+def ttl_cache(ttl: float) -> Callable:
+    """
+    Memoize function results for a fixed number of seconds
+
+    Works for both regular and async functions. A result is only cached
+    when the call returns normally, so failures are retried on next call.
+    Concurrent async calls for an expired key share one in-flight call.
+    The wrapper exposes cache_clear() to drop all entries.
+
+    Parameters:
+        ttl (float): Seconds a cached result stays valid
+
+    Returns:
+        Callable: Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        cache: Dict[Hashable, Tuple[float, Any]] = {}
+
+        def lookup(key: Hashable) -> Tuple[bool, Any]:
+            entry = cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return True, entry[1]
+            return False, None
+
+        def store(key: Hashable, value: Any):
+            cache[key] = (time.monotonic() + ttl, value)
+
+        if asyncio.iscoroutinefunction(func):
+            pending: Dict[Hashable, asyncio.Future] = {}
+
+            def finish(key: Hashable, future: asyncio.Future):
+                pending.pop(key, None)
+                if not future.cancelled() and future.exception() is None:
+                    store(key, future.result())
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                key = args + tuple(sorted(kwargs.items()))
+                hit, value = lookup(key)
+                if hit:
+                    return value
+                    
+                # First caller starts the download, the rest await it
+                future = pending.get(key)
+                if future is None:
+                    future = asyncio.ensure_future(func(*args, **kwargs))
+                    pending[key] = future
+                    future.add_done_callback(functools.partial(finish, key))
+                    
+                # A cancelled caller does not cancel the call for the others
+                return await asyncio.shield(future)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                key = args + tuple(sorted(kwargs.items()))
+                hit, value = lookup(key)
+                if not hit:
+                    value = func(*args, **kwargs)
+                    store(key, value)
+                return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+class ExpiringSet:
+    """Set whose members expire a fixed number of seconds after being added"""
+
+    def __init__(self, ttl: float, maxsize: int = 4096):
+        """
+        Initialize Expiring Set
+
+        Parameters:
+            ttl (float): Seconds a member stays in the set
+            maxsize (int): Members kept before the oldest are dropped
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._expiry: Dict[Hashable, float] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        expiry = self._expiry.get(key)
+        return expiry is not None and expiry > time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._expiry)
+
+    def add(self, key: Hashable) -> bool:
+        """
+        Add key unless it is already a live member
+
+        Returns:
+            bool: True if the key was added, False if it was still present
+        """
+        now = time.monotonic()
+        expiry = self._expiry.get(key)
+        if expiry is not None and expiry > now:
+            return False
+
+        if len(self._expiry) >= self.maxsize:
+            self._expiry = {k: v for k, v in self._expiry.items() if v > now}
+            # Still full: drop oldest entries (dicts keep insertion order)
+            while len(self._expiry) >= self.maxsize:
+                del self._expiry[next(iter(self._expiry))]
+
+        self._expiry.pop(key, None)
+        self._expiry[key] = now + self.ttl
+        return True
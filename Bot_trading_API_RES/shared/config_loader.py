@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Config Loader
+Author: Anhbaza01
+Version: 1.0.0
+Last Updated: 2026-10-16 13:47:20 UTC
+
+Loads config.yaml with LibYAML and keeps the parsed result in memory
+until the file changes. Nothing is copied to disk: the config holds
+the Telegram bot token
+"""
+
+import os
+import copy
+import yaml
+from typing import Any, Dict, Tuple
+
+# LibYAML's C parser when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+def read_yaml(path: str) -> Dict[str, Any]:
+    """
+    Read a YAML file in one pass with the fastest safe loader
+
+    Parameters:
+        path (str): Path to the YAML file
+
+    Returns:
+        Dict[str, Any]: Parsed document, empty if the file is empty
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+
+    # Files saved by Windows editors may carry a BOM or a legacy encoding
+    try:
+        text = raw.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        text = raw.decode('latin-1')
+
+    return yaml.load(text, Loader=YAML_LOADER) or {}
+
+# Absolute path -> (mtime, parsed config) of the last load
+_config_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+def load_config_file(config_path: str) -> Dict[str, Any]:
+    """
+    Load YAML config, reusing the last parse while the file is unchanged
+
+    Parameters:
+        config_path (str): Path to config.yaml
+
+    Returns:
+        Dict[str, Any]: Parsed configuration, a copy the caller may modify
+    """
+    path = os.path.abspath(config_path)
+    mtime = os.path.getmtime(path)
+
+    cached = _config_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, read_yaml(path))
+        _config_cache[path] = cached
+
+    return copy.deepcopy(cached[1])
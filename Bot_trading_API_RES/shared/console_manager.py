@@ -12,6 +12,7 @@ import asyncio
 import curses
 from datetime import datetime
 from typing import List, Dict, Optional
+from .time_utils import utc_now_str
 
 class ConsoleManager:
     def __init__(self, title: str = "Trading Bot"):
@@ -85,7 +86,7 @@ class ConsoleManager:
             current_y += 1
 
             # Draw current time and user
-            time_str = f"Time (UTC): {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}"
+            time_str = f"Time (UTC): {utc_now_str()}"
             self.screen.addstr(current_y, 0, time_str)
             current_y += 1
             
@@ -128,16 +129,17 @@ class ConsoleManager:
                         f"{signal['symbol']} - {signal['type']}", signal_color)
                     current_y += 1
                     
+                    decimals = signal.get('decimals', 8)
                     self.screen.addstr(current_y, 2, 
-                        f"Entry: {signal['entry']:.8f}")
+                        f"Entry: {signal['entry']:.{decimals}f}")
                     current_y += 1
                     
                     self.screen.addstr(current_y, 2,
-                        f"TP: {signal['tp']:.8f}")
+                        f"TP: {signal['tp']:.{decimals}f}")
                     current_y += 1
                     
                     self.screen.addstr(current_y, 2,
-                        f"SL: {signal['sl']:.8f}")
+                        f"SL: {signal['sl']:.{decimals}f}")
                     current_y += 1
                     
                     conf_color = (curses.color_pair(1) 
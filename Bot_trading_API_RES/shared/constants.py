@@ -9,11 +9,56 @@ Last Updated: 2025-05-23 19:19:10 UTC
 # Bot Configuration
 TRADING_BOT_NAME = "BinanceFuturesBot"
 VERSION = "1.0.0"
+BOT_USER = "Anhbaza01"      # Shown in banners and notifications
 
 # Trading Parameters
 MAX_TRADES_PER_SYMBOL = 5
 MIN_VOLUME_USDT = 1000000  # 1M USDT minimum volume
 UPDATE_INTERVAL = 60       # 60 seconds
+MAX_CONCURRENT_REQUESTS = 20  # Parallel Binance REST requests per scan
+
+# Market Data
+BINANCE_API_URL = "https://api.binance.com"
+BINANCE_STREAM_URL = "wss://stream.binance.com:9443"
+STREAM_MAX_FRAME = 4 * 1024 * 1024  # All-market ticker frames can pass websockets' 1 MiB default
+HTTP_POOL_LIMIT = 50       # Pooled keep-alive connections
+HTTP_POOL_LIMIT_PER_HOST = 30
+HTTP_KEEPALIVE_TIMEOUT = 600
+HTTP_DNS_CACHE_TTL = 300
+HTTP_TIMEOUT = 10          # Seconds before a stalled REST request gives up its slot
+KLINE_INTERVAL = "15m"
+KLINE_LIMIT = 100          # Candles kept per symbol
+KLINE_REFRESH_LIMIT = 3    # Candles fetched to top up a warm window
+STREAM_CHUNK_SIZE = 200    # Kline streams per multiplexed socket
+KLINE_BATCH_WINDOW = 0.5   # Seconds to collect closed candles into one screening batch
+PAIRS_CACHE_TTL = 21600    # Refresh pair universe every 6 hours
+VOLUMES_CACHE_TTL = 300    # 24hr volumes saved by a recent run are reused on restart
+BINANCE_WEIGHT_LIMIT = 5400  # 90% of the 6000/min spot request weight
+KLINES_WEIGHT = 2            # Weight of one klines request (limit <= 100)
+TICKER_24H_WEIGHT = 80       # Weight of 24hr ticker for all symbols
+EXCHANGE_INFO_WEIGHT = 20    # Weight of exchange info for all symbols
+FUTURES_WEIGHT_LIMIT = 2160  # 90% of the 2400/min futures request weight
+PRICE_MOVE_TRIGGER = 0.02    # Price move (2%) that triggers analysis before the next scan
+SCAN_OVERRUN_WARN = 3        # Consecutive scan cycles over the interval before warning
+
+# Signals already sent are not repeated within this window
+SIGNAL_DEDUP_TTL = 1800
+SIGNAL_DEDUP_MAXSIZE = 4096
+
+# Telegram
+TELEGRAM_BATCH_WINDOW = 0.5          # Seconds to collect signals into one message
+TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+TELEGRAM_BATCH_MAX = 10              # Signals combined into one message at most
+TELEGRAM_BATCH_SEPARATOR = "\n\n---\n\n"
+TELEGRAM_QUEUE_MAX = 1000            # Queued messages before new ones are dropped
+
+# Kline array columns
+KLINE_OPEN_TIME = 0
+KLINE_OPEN = 1
+KLINE_HIGH = 2
+KLINE_LOW = 3
+KLINE_CLOSE = 4
+KLINE_VOLUME = 5
 
 # Technical Indicators
 RSI_PERIOD = 14
@@ -21,9 +66,11 @@ RSI_OVERBOUGHT = 70
 RSI_OVERSOLD = 30
 EMA_SHORT = 20
 EMA_LONG = 50
+ATR_PERIOD = 14
 
 # Signal Parameters
 VOLUME_RATIO_MIN = 2.0    # Minimum volume increase
+VOLUME_MA_PERIOD = 19     # Previous candles in volume average
 MIN_RR_RATIO = 1.5        # Minimum Risk:Reward ratio
 CONFIDENCE_THRESHOLD = 65  # Minimum confidence score
 
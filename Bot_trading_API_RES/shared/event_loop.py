@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Event Loop Setup
+Author: Anhbaza01
+Version: 1.0.0
+Last Updated: 2026-10-16 15:48:02 UTC
+
+Picks the fastest available asyncio event loop for the platform:
+uvloop (libuv) on Linux/macOS, winloop on Windows when installed,
+and shuts it down cleanly on exit
+"""
+
+import os
+import asyncio
+
+def install_event_loop_policy():
+    """Install libuv-based loop policy, selector policy as Windows fallback
+    and the default asyncio loop when uvloop is not installed"""
+    if os.name == 'nt':
+        try:
+            import winloop
+            winloop.install()
+        except ImportError:
+            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    else:
+        try:
+            import uvloop
+        except ImportError:
+            return
+        # Policy set directly, uvloop.install() is deprecated on Python 3.12+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+def shutdown_loop(loop: asyncio.AbstractEventLoop):
+    """
+    Cancel leftover tasks, flush async generators and the default
+    executor, then close the loop. Safe to call on a closed loop.
+
+    Parameters:
+        loop (AbstractEventLoop): Loop the program ran on
+    """
+    if loop.is_closed():
+        return
+
+    try:
+        # Background tasks (streams, listeners) loop forever unless cancelled
+        tasks = [t for t in asyncio.all_tasks(loop) if not t.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        loop.close()
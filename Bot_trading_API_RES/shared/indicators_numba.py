@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Compiled Indicator Kernels
+Author: Anhbaza01
+Version: 1.0.0
+Last Updated: 2026-10-16 11:20:48 UTC
+
+Numba kernels for indicator math that has to walk a full candle
+history. Compiled once and cached on disk (cache=True) and run without
+the GIL (nogil=True) so worker threads can call them; without numba
+installed they run as plain Python.
+"""
+
+import numpy as np
+from typing import Tuple
+from ._njit import njit, prange, HAS_NUMBA
+
+@njit(cache=True, fastmath=True, nogil=True)
+def rsi_wilder(close: np.ndarray, period: int) -> float:
+    """
+    Wilder RSI of the last close
+
+    SMA seed over the first period changes, then Wilder's RMA
+    (alpha = 1 / period) over the rest.
+
+    Parameters:
+        close (np.ndarray): Close prices
+        period (int): RSI period
+
+    Returns:
+        float: RSI value
+    """
+    avg_gain = 0.0
+    avg_loss = 0.0
+
+    for i in range(1, close.shape[0]):
+        change = close[i] - close[i - 1]
+        gain = change if change > 0.0 else 0.0
+        loss = -change if change < 0.0 else 0.0
+
+        if i <= period:
+            avg_gain += gain / period
+            avg_loss += loss / period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+
+    if avg_loss == 0.0:
+        return 100.0
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+@njit(cache=True, fastmath=True, nogil=True)
+def seed_indicators(
+    close: np.ndarray,
+    volume: np.ndarray,
+    period: int,
+    volume_period: int
+) -> Tuple[float, float, float]:
+    """
+    Wilder RSI averages and trailing volume sum in one pass
+
+    Parameters:
+        close (np.ndarray): Close prices of closed candles
+        volume (np.ndarray): Volumes of the same candles
+        period (int): RSI period
+        volume_period (int): Number of trailing volumes to sum
+
+    Returns:
+        Tuple[float, float, float]: avg_gain, avg_loss, volume_sum
+    """
+    n = close.shape[0]
+    volume_start = n - volume_period
+    avg_gain = 0.0
+    avg_loss = 0.0
+    volume_sum = 0.0
+
+    for i in range(1, n):
+        change = close[i] - close[i - 1]
+        gain = change if change > 0.0 else 0.0
+        loss = -change if change < 0.0 else 0.0
+
+        if i <= period:
+            # Simple average seed over the first period changes
+            avg_gain += gain / period
+            avg_loss += loss / period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+
+        if i >= volume_start:
+            volume_sum += volume[i]
+
+    return avg_gain, avg_loss, volume_sum
+
+@njit(parallel=True, cache=True, nogil=True)
+def seed_indicators_batch(
+    close: np.ndarray,
+    volume: np.ndarray,
+    period: int,
+    volume_period: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    seed_indicators for many symbols at once, one row per symbol
+
+    Rows are processed in parallel threads outside the GIL.
+
+    Parameters:
+        close (np.ndarray): (n_symbols, n_candles) close prices
+        volume (np.ndarray): (n_symbols, n_candles) volumes
+        period (int): RSI period
+        volume_period (int): Number of trailing volumes to sum
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: avg_gain, avg_loss,
+        volume_sum arrays of length n_symbols
+    """
+    n = close.shape[0]
+    avg_gain = np.empty(n)
+    avg_loss = np.empty(n)
+    volume_sum = np.empty(n)
+
+    for i in prange(n):
+        avg_gain[i], avg_loss[i], volume_sum[i] = seed_indicators(
+            close[i], volume[i], period, volume_period
+        )
+
+    return avg_gain, avg_loss, volume_sum
+
+@njit(cache=True, fastmath=True, nogil=True)
+def rsi_sma(close: np.ndarray, period: int) -> float:
+    """
+    RSI from simple averages of the last period gains and losses
+
+    Parameters:
+        close (np.ndarray): Close prices, at least period + 1
+        period (int): RSI period
+
+    Returns:
+        float: RSI value
+    """
+    n = close.shape[0]
+    gain_sum = 0.0
+    loss_sum = 0.0
+
+    for i in range(n - period, n):
+        change = close[i] - close[i - 1]
+        if change > 0.0:
+            gain_sum += change
+        else:
+            loss_sum -= change
+
+    if loss_sum == 0.0:
+        return 100.0
+    return 100.0 - 100.0 / (1.0 + gain_sum / loss_sum)
+
+@njit(cache=True, fastmath=True, nogil=True)
+def atr_sma(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> float:
+    """
+    Average true range over the last period candles (simple mean)
+
+    Parameters:
+        high (np.ndarray): High prices
+        low (np.ndarray): Low prices
+        close (np.ndarray): Close prices, at least 2
+        period (int): Number of true ranges averaged
+
+    Returns:
+        float: ATR in price units
+    """
+    n = close.shape[0]
+    start = max(n - period, 1)
+    tr_sum = 0.0
+
+    for i in range(start, n):
+        tr_sum += max(
+            high[i] - low[i],
+            abs(high[i] - close[i - 1]),
+            abs(low[i] - close[i - 1])
+        )
+
+    return tr_sum / (n - start)
+
+@njit(cache=True, fastmath=True, nogil=True)
+def directional_strength(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> float:
+    """
+    Simplified ADX: DX of the last period directional moves, 0-1
+
+    Parameters:
+        high (np.ndarray): High prices
+        low (np.ndarray): Low prices
+        close (np.ndarray): Close prices, at least period + 1
+        period (int): Number of candles averaged
+
+    Returns:
+        float: Trend strength between 0 and 1
+    """
+    n = close.shape[0]
+    plus_dm = 0.0
+    minus_dm = 0.0
+    tr_sum = 0.0
+
+    for i in range(n - period, n):
+        up_move = high[i] - high[i - 1]
+        down_move = low[i - 1] - low[i]
+        if up_move > down_move and up_move > 0.0:
+            plus_dm += up_move
+        if down_move > up_move and down_move > 0.0:
+            minus_dm += down_move
+        tr_sum += max(
+            high[i] - low[i],
+            abs(high[i] - close[i - 1]),
+            abs(low[i] - close[i - 1])
+        )
+
+    if tr_sum <= 0.0:
+        return 0.0
+
+    # Sums share the 1 / period factor, it cancels out of DX
+    plus_di = 100.0 * plus_dm / tr_sum
+    minus_di = 100.0 * minus_dm / tr_sum
+    if plus_di + minus_di <= 0.0:
+        return 0.0
+    return min(abs(plus_di - minus_di) / (plus_di + minus_di), 1.0)
+
+@njit(cache=True, fastmath=True, nogil=True)
+def trend_indicators(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    rsi_period: int,
+    ema_fast: int,
+    ema_slow: int,
+    atr_period: int
+) -> Tuple[float, float, float, float]:
+    """
+    Wilder RSI, two EMAs and ATR in a single pass over the candles
+
+    Each value matches its standalone form: rsi_wilder, an EMA seeded
+    with the SMA of its first period closes (last close if too short)
+    and atr_sma.
+
+    Parameters:
+        high (np.ndarray): High prices
+        low (np.ndarray): Low prices
+        close (np.ndarray): Close prices, at least 2
+        rsi_period (int): RSI period
+        ema_fast (int): Fast EMA period
+        ema_slow (int): Slow EMA period
+        atr_period (int): Number of true ranges averaged
+
+    Returns:
+        Tuple[float, float, float, float]: rsi, fast EMA, slow EMA, ATR
+    """
+    n = close.shape[0]
+    fast_k = 2.0 / (ema_fast + 1)
+    slow_k = 2.0 / (ema_slow + 1)
+    atr_start = max(n - atr_period, 1)
+    avg_gain = 0.0
+    avg_loss = 0.0
+    fast = 0.0
+    slow = 0.0
+    tr_sum = 0.0
+
+    for i in range(n):
+        price = close[i]
+
+        # EMAs: sum the seed window, then recurse
+        if i < ema_fast:
+            fast += price
+            if i == ema_fast - 1:
+                fast /= ema_fast
+        else:
+            fast = price * fast_k + fast * (1.0 - fast_k)
+        if i < ema_slow:
+            slow += price
+            if i == ema_slow - 1:
+                slow /= ema_slow
+        else:
+            slow = price * slow_k + slow * (1.0 - slow_k)
+
+        if i == 0:
+            continue
+
+        change = price - close[i - 1]
+        gain = change if change > 0.0 else 0.0
+        loss = -change if change < 0.0 else 0.0
+        if i <= rsi_period:
+            avg_gain += gain / rsi_period
+            avg_loss += loss / rsi_period
+        else:
+            avg_gain = (avg_gain * (rsi_period - 1) + gain) / rsi_period
+            avg_loss = (avg_loss * (rsi_period - 1) + loss) / rsi_period
+
+        if i >= atr_start:
+            tr_sum += max(
+                high[i] - low[i],
+                abs(high[i] - close[i - 1]),
+                abs(low[i] - close[i - 1])
+            )
+
+    rsi = 100.0 if avg_loss == 0.0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    if n < ema_fast:
+        fast = close[n - 1]
+    if n < ema_slow:
+        slow = close[n - 1]
+    return rsi, fast, slow, tr_sum / (n - atr_start)
+
+def warm_up():
+    """
+    Compile every kernel for float64 input before the first scan
+
+    With cache=True this loads the machine code saved by an earlier run,
+    otherwise it compiles once; either way the cost is paid here rather
+    than inside the first scan. Does nothing without numba.
+    """
+    if not HAS_NUMBA:
+        return
+
+    row = np.linspace(1.0, 2.0, 32)
+    rows = np.vstack((row, row))
+    rsi_wilder(row, 14)
+    rsi_sma(row, 14)
+    atr_sma(row, row, row, 14)
+    directional_strength(row, row, row, 14)
+    trend_indicators(row, row, row, 14, 20, 50, 14)
+    seed_indicators(row, row, 14, 19)
+    seed_indicators_batch(rows, rows, 14, 19)
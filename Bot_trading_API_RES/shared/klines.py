@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Kline Data Module
+Author: Anhbaza01
+Version: 1.0.0
+Last Updated: 2026-10-16 10:02:17 UTC
+
+Struct-of-arrays container for candle data so indicators can work on
+contiguous float64 arrays instead of per-candle Python objects
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import Iterable, List, Sequence, Tuple
+from .constants import KLINE_VOLUME
+
+@dataclass(frozen=True)
+class Klines:
+    """Candles for one symbol, one contiguous array per field"""
+    ts: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence]) -> 'Klines':
+        """
+        Build from kline rows in Binance order
+
+        Parameters:
+            rows (Iterable[Sequence]): Rows starting with open_time, open,
+                high, low, close, volume (numbers or numeric strings)
+
+        Returns:
+            Klines: Converted candles
+        """
+        # Numeric strings parse straight into float64, no object array
+        data = np.asarray(list(rows), dtype=np.float64)[:, :KLINE_VOLUME + 1]
+        columns = np.ascontiguousarray(data.T)
+        return cls(*columns)
+
+    def rows(self) -> List[Tuple[float, ...]]:
+        """Convert back to (open_time, open, high, low, close, volume) rows"""
+        return list(zip(
+            self.ts.tolist(),
+            self.open.tolist(),
+            self.high.tolist(),
+            self.low.tolist(),
+            self.close.tolist(),
+            self.volume.tolist()
+        ))
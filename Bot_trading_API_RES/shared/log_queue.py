@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Queued Logging Module
+Author: Anhbaza01
+Version: 1.0.0
+Last Updated: 2026-10-16 14:12:37 UTC
+
+Moves log formatting and file/console writes off the event loop thread:
+loggers only enqueue records, a QueueListener thread does the I/O
+"""
+
+import queue
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from typing import Tuple
+
+LOG_FORMAT = '%(asctime)s UTC | %(levelname)s | %(message)s'
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+def start_queue_logging(*handlers: logging.Handler) -> Tuple[QueueHandler, QueueListener]:
+    """
+    Start a background listener that feeds records to the given handlers
+
+    Parameters:
+        *handlers (logging.Handler): Destination handlers (file, console)
+
+    Returns:
+        Tuple[QueueHandler, QueueListener]: Handler to install on the root
+        logger, and the running listener to stop() on shutdown
+    """
+    formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+    for handler in handlers:
+        if handler.formatter is None:
+            handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+
+    # Message only: timestamp and level are added by the destination handlers
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    return queue_handler, listener
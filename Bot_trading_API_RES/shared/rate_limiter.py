@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Request Weight Limiter
+Author: Anhbaza01
+Version: 1.0.0
+Last Updated: 2026-10-16 12:41:09 UTC
+
+Keeps REST traffic under Binance's per-minute request weight limit,
+using the X-MBX-USED-WEIGHT-1m header the exchange returns
+"""
+
+import time
+import asyncio
+from typing import Mapping
+from .constants import BINANCE_WEIGHT_LIMIT
+
+USED_WEIGHT_HEADER = "X-MBX-USED-WEIGHT-1m"
+
+class WeightLimiter:
+    def __init__(self, limit: int = BINANCE_WEIGHT_LIMIT):
+        """
+        Initialize Weight Limiter
+
+        Parameters:
+            limit (int): Weight allowed per minute
+        """
+        self.limit = limit
+        self.used = 0
+        self._minute = 0
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _roll_window(self, now: float):
+        """Reset usage when a new minute starts (Binance counts per minute)"""
+        minute = int(now // 60)
+        if minute != self._minute:
+            self._minute = minute
+            self.used = 0
+
+    async def acquire(self, weight: int = 1):
+        """
+        Wait until the request weight fits in the current minute
+
+        Parameters:
+            weight (int): Weight of the request about to be sent
+        """
+        async with self._lock:
+            while True:
+                now = time.time()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+
+                self._roll_window(now)
+                if self.used + weight <= self.limit:
+                    self.used += weight
+                    return
+
+                # Budget spent, wait for the next minute
+                await asyncio.sleep(60 - now % 60)
+
+    def update(self, headers: Mapping[str, str]):
+        """
+        Sync usage with the weight reported by the exchange
+
+        Parameters:
+            headers (Mapping): Response headers
+        """
+        used = headers.get(USED_WEIGHT_HEADER)
+        if used is not None:
+            self._roll_window(time.time())
+            self.used = max(self.used, int(used))
+
+    def back_off(self, seconds: float):
+        """
+        Block all requests after a 429/418 response
+
+        Parameters:
+            seconds (float): Retry-After value from the exchange
+        """
+        self._blocked_until = max(self._blocked_until, time.time() + seconds)
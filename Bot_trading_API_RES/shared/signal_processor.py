@@ -12,28 +12,93 @@ This module handles trading signal processing including:
 """
 
 import logging
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+import numpy as np
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import Dict, Any, List, Optional, Tuple
 from .constants import (
     RSI_PERIOD,
     RSI_OVERBOUGHT,
     RSI_OVERSOLD,
+    EMA_SHORT,
+    EMA_LONG,
+    ATR_PERIOD,
     MIN_RR_RATIO,
-    VOLUME_RATIO_MIN
+    VOLUME_RATIO_MIN,
+    VOLUME_MA_PERIOD
 )
+from .klines import Klines
+from .indicators_numba import seed_indicators, seed_indicators_batch, trend_indicators
+from .time_utils import utc_now_str
+
+# Notification templates parsed once, prices use the symbol's tick size decimals
+NEW_SIGNAL_TEMPLATE = (
+    "\n🔔 <b>Tín hiệu giao dịch mới</b>\n"
+    "📊 {symbol}\n"
+    "📈 {type}\n"
+    "📉 RSI: {rsi:.1f}\n"
+    "💰 Giá vào: ${entry:.{decimals}f}\n"
+    "✅ Take Profit: ${tp:.{decimals}f}\n"
+    "❌ Stop Loss: ${sl:.{decimals}f}\n"
+    "⚖️ R:R = {rr:.1f}\n"
+    "📊 Độ tin cậy: {confidence}%\n"
+    "⌚ {time} UTC\n"
+).format
+
+UPDATE_SIGNAL_TEMPLATE = (
+    "\n📝 <b>Cập nhật tín hiệu</b>\n"
+    "📊 {symbol}\n"
+    "📈 {type}\n"
+    "💰 Giá mới: ${entry:.{decimals}f}\n"
+    "✅ TP mới: ${tp:.{decimals}f}\n"
+    "❌ SL mới: ${sl:.{decimals}f}\n"
+    "⚖️ R:R = {rr:.1f}\n"
+    "⌚ {time} UTC\n"
+).format
+
+CLOSE_SIGNAL_TEMPLATE = (
+    "\n🔒 <b>Đóng tín hiệu</b>\n"
+    "📊 {symbol}\n"
+    "📈 {type}\n"
+    "💰 Giá vào: ${entry:.{decimals}f}\n"
+    "💵 Giá đóng: ${close_price:.{decimals}f}\n"
+    "📊 P/L: {pnl:+.2f}%\n"
+    "📝 Lý do: {close_reason}\n"
+    "⌚ {time} UTC\n"
+).format
+
+@dataclass
+class IndicatorState:
+    """Incremental indicator state committed up to the last closed candle"""
+    __slots__ = ('avg_gain', 'avg_loss', 'last_close', 'open_time', 'volumes', 'volume_sum')
+    
+    avg_gain: float
+    avg_loss: float
+    last_close: float
+    open_time: float
+    volumes: deque          # Last VOLUME_MA_PERIOD closed volumes
+    volume_sum: float
 
 class SignalProcessor:
     def __init__(self, logger: Optional[logging.Logger] = None):
         """Initialize Signal Processor"""
         self.logger = logger or logging.getLogger(__name__)
+        
+        self._indicator_state: Dict[str, IndicatorState] = {}
 
-    def calculate_confidence(self, signal: Dict[str, Any], klines: List[Dict]) -> float:
+    def calculate_confidence(
+        self,
+        signal: Dict[str, Any],
+        klines: Klines,
+        volume_ratio: Optional[float] = None
+    ) -> float:
         """
         Calculate confidence score for a trading signal (0-100%)
         
         Parameters:
             signal (Dict[str, Any]): Trading signal data
-            klines (List[Dict]): Historical price data
+            klines (Klines): Historical price data
+            volume_ratio (float): Precomputed volume ratio, if available
             
         Returns:
             float: Confidence score 0-100%
@@ -50,31 +115,30 @@ class SignalProcessor:
             confidence += rsi_score
             
             # 2. Volume Weight (30%)
-            if len(klines) >= 20:
-                current_volume = klines[-1]['volume']
-                avg_volume = sum(k['volume'] for k in klines[-20:-1]) / 19
-                volume_ratio = current_volume / avg_volume
+            if len(klines) > VOLUME_MA_PERIOD:
+                if volume_ratio is None:
+                    volumes = klines.volume
+                    volume_ratio = volumes[-1] / volumes[-VOLUME_MA_PERIOD - 1:-1].mean()
                 volume_score = min((volume_ratio - 1) * 30, 30)
                 confidence += max(volume_score, 0)
             
             # 3. Price Action (20%)
             if len(klines) >= 3:
-                current = klines[-1]
-                prev1 = klines[-2]
-                prev2 = klines[-3]
+                opens = klines.open
+                closes = klines.close
                 
                 # Check candle patterns
                 if signal['type'] == "LONG":
                     # Bullish pattern
-                    if (current['close'] > current['open'] and
-                        current['close'] > prev1['high'] and
-                        prev1['close'] < prev1['open']):
+                    if (closes[-1] > opens[-1] and
+                        closes[-1] > klines.high[-2] and
+                        closes[-2] < opens[-2]):
                         confidence += 20
                 else:
                     # Bearish pattern
-                    if (current['close'] < current['open'] and
-                        current['close'] < prev1['low'] and
-                        prev1['close'] > prev1['open']):
+                    if (closes[-1] < opens[-1] and
+                        closes[-1] < klines.low[-2] and
+                        closes[-2] > opens[-2]):
                         confidence += 20
             
             # 4. Risk-Reward Ratio (20%)
@@ -85,19 +149,19 @@ class SignalProcessor:
             rr_score = min(rr * 10, 20)
             confidence += rr_score
             
-            return round(confidence, 1)
+            return round(float(confidence), 1)
             
         except Exception as e:
             self.logger.error(f"Error calculating confidence: {str(e)}")
             return 0
 
-    def analyze_trend(self, signal: Dict[str, Any], klines: List[Dict]) -> Dict[str, Any]:
+    def analyze_trend(self, signal: Dict[str, Any], klines: Klines) -> Dict[str, Any]:
         """
         Analyze current trend and detect changes
         
         Parameters:
             signal (Dict[str, Any]): Current active signal
-            klines (List[Dict]): Historical price data
+            klines (Klines): Historical price data
             
         Returns:
             Dict[str, Any]: Analysis result containing:
@@ -113,13 +177,10 @@ class SignalProcessor:
                 }
             
             # Get current data
-            current_price = klines[-1]['close']
-            closes = [k['close'] for k in klines]
+            current_price = klines.close[-1]
             
-            # Calculate indicators
-            rsi = self._calculate_rsi(closes)
-            ema20 = self._calculate_ema(closes, 20)
-            ema50 = self._calculate_ema(closes, 50)
+            # RSI, EMA20/50 and ATR from one pass over the candles
+            rsi, ema20, ema50, atr = self._trend_indicators(klines)
             
             signal_type = signal['type']
             result = {
@@ -154,8 +215,6 @@ class SignalProcessor:
             
             # Calculate new targets if trend reinforced
             if result['trend_reinforced']:
-                atr = self._calculate_atr(klines)
-                
                 if signal_type == "LONG":
                     sl = current_price - (atr * 2)
                     tp = current_price + (atr * 2 * MIN_RR_RATIO)
@@ -176,56 +235,65 @@ class SignalProcessor:
                 'trend_changed': False,
                 'trend_reinforced': False
             }
-    def check_volume_signal(self, klines: List[Dict]) -> Optional[str]:
+    def check_volume_signal(
+        self,
+        klines: Klines,
+        volume_ratio: Optional[float] = None
+    ) -> Optional[str]:
      """Check for volume breakout signal"""
      try:
-        if len(klines) < 20:
-            self.logger.info("Insufficient klines for volume analysis")
+        if len(klines) <= VOLUME_MA_PERIOD:
+            self.logger.debug("Insufficient klines for volume analysis")
             return None
             
         # Get current candle data
-        current = klines[-1]
-        prev = klines[-2]
+        opens = klines.open
+        closes = klines.close
+        volumes = klines.volume
         
         # Calculate volume moving average
-        volume_ma = sum(k['volume'] for k in klines[-20:-1]) / 19
-        volume_change = current['volume'] / volume_ma
+        if volume_ratio is None:
+            volume_ma = volumes[-VOLUME_MA_PERIOD - 1:-1].mean()
+            volume_change = volumes[-1] / volume_ma
+        else:
+            volume_change = volume_ratio
+            volume_ma = volumes[-1] / volume_ratio if volume_ratio else 0
         
-        self.logger.info(
-            f"Volume analysis: Current = {current['volume']:.2f}, "
-            f"MA = {volume_ma:.2f}, Ratio = {volume_change:.2f}x"
+        self.logger.debug(
+            "Volume analysis: Current = %.2f, MA = %.2f, Ratio = %.2fx",
+            volumes[-1], volume_ma, volume_change
         )
         
         if volume_change >= VOLUME_RATIO_MIN:
-            self.logger.info(f"Volume breakout detected ({volume_change:.2f}x)")
+            self.logger.info("Volume breakout detected (%.2fx)", volume_change)
             
             # Calculate price changes
-            price_change = (current['close'] - current['open']) / current['open'] * 100
-            prev_change = (prev['close'] - prev['open']) / prev['open'] * 100
+            price_change = (closes[-1] - opens[-1]) / opens[-1] * 100
+            prev_change = (closes[-2] - opens[-2]) / opens[-2] * 100
             
-            self.logger.info(
-                f"Price changes: Current = {price_change:+.2f}%, "
-                f"Previous = {prev_change:+.2f}%"
+            self.logger.debug(
+                "Price changes: Current = %+.2f%%, Previous = %+.2f%%",
+                price_change, prev_change
             )
             
             # Check for trend continuation
             if (price_change > 0 and prev_change > 0 and 
-                current['close'] > prev['close']):
+                closes[-1] > closes[-2]):
                 self.logger.info("Bullish continuation confirmed")
                 return "LONG"
             elif (price_change < 0 and prev_change < 0 and 
-                  current['close'] < prev['close']):
+                  closes[-1] < closes[-2]):
                 self.logger.info("Bearish continuation confirmed")
                 return "SHORT"
             else:
-                self.logger.info("No clear trend continuation")
+                self.logger.debug("No clear trend continuation")
         else:
-            self.logger.info(f"Volume below threshold ({volume_change:.2f}x < {VOLUME_RATIO_MIN}x)")
+            self.logger.debug("Volume below threshold (%.2fx < %sx)", volume_change, VOLUME_RATIO_MIN)
         
         return None
         
      except Exception as e:
-        self.logger.error(f"Error checking volume signal: {str(e)}")
+        self.logger.error("Error checking volume signal: %s", e, exc_info=True)
         return None
     def format_signal_message(self, signal: Dict[str, Any], msg_type: str = "NEW") -> str:
         """
@@ -243,120 +311,329 @@ class SignalProcessor:
             tp = signal['tp']
             sl = signal['sl']
             rr = abs((tp - entry) / (entry - sl))
+            decimals = signal.get('decimals', 2)
             
             if msg_type == "NEW":
-                return f"""
-🔔 <b>Tín hiệu giao dịch mới</b>
-📊 {signal['symbol']}
-📈 {signal['type']}
-📉 RSI: {signal.get('rsi', 0):.1f}
-💰 Giá vào: ${entry:.2f}
-✅ Take Profit: ${tp:.2f}
-❌ Stop Loss: ${sl:.2f}
-⚖️ R:R = {rr:.1f}
-📊 Độ tin cậy: {signal.get('confidence', 0)}%
-⌚ {signal['time'].strftime('%Y-%m-%d %H:%M:%S')} UTC
-"""
+                return NEW_SIGNAL_TEMPLATE(
+                    symbol=signal['symbol'],
+                    type=signal['type'],
+                    rsi=signal.get('rsi', 0),
+                    entry=entry,
+                    tp=tp,
+                    sl=sl,
+                    decimals=decimals,
+                    rr=rr,
+                    confidence=signal.get('confidence', 0),
+                    time=signal['time'].strftime('%Y-%m-%d %H:%M:%S')
+                )
             elif msg_type == "UPDATE":
-                return f"""
-📝 <b>Cập nhật tín hiệu</b>
-📊 {signal['symbol']}
-📈 {signal['type']}
-💰 Giá mới: ${entry:.2f}
-✅ TP mới: ${tp:.2f}
-❌ SL mới: ${sl:.2f}
-⚖️ R:R = {rr:.1f}
-⌚ {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC
-"""
+                return UPDATE_SIGNAL_TEMPLATE(
+                    symbol=signal['symbol'],
+                    type=signal['type'],
+                    entry=entry,
+                    tp=tp,
+                    sl=sl,
+                    decimals=decimals,
+                    rr=rr,
+                    time=utc_now_str()
+                )
             elif msg_type == "CLOSE":
                 pnl = ((signal['close_price'] - entry) / entry) * 100
                 if signal['type'] == "SHORT":
                     pnl *= -1
                     
-                return f"""
-🔒 <b>Đóng tín hiệu</b>
-📊 {signal['symbol']}
-📈 {signal['type']}
-💰 Giá vào: ${entry:.2f}
-💵 Giá đóng: ${signal['close_price']:.2f}
-📊 P/L: {pnl:+.2f}%
-📝 Lý do: {signal.get('close_reason', 'MANUAL')}
-⌚ {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC
-"""
+                return CLOSE_SIGNAL_TEMPLATE(
+                    symbol=signal['symbol'],
+                    type=signal['type'],
+                    entry=entry,
+                    close_price=signal['close_price'],
+                    decimals=decimals,
+                    pnl=pnl,
+                    close_reason=signal.get('close_reason', 'MANUAL'),
+                    time=utc_now_str()
+                )
             return ""
             
         except Exception as e:
             self.logger.error(f"Error formatting message: {str(e)}")
             return ""
 
-    def _calculate_rsi(self, closes: List[float], period: int = RSI_PERIOD) -> float:
-        """Calculate RSI indicator"""
+    def update_indicators(
+        self,
+        symbol: str,
+        klines: Klines,
+        period: int = RSI_PERIOD
+    ) -> Tuple[float, float]:
+        """
+        Update cached RSI and volume state with new candles
+        
+        Each newly closed candle costs one Wilder step plus one running
+        volume sum update. The state is reseeded from the full history on
+        first use or when the candles no longer follow the cached one
+        (gap, reconnect).
+        
+        Parameters:
+            symbol (str): Trading pair symbol
+            klines (Klines): Historical price data, last candle may still be open
+            period (int): RSI period
+            
+        Returns:
+            Tuple[float, float]: Current RSI and volume ratio against
+            the average of the previous VOLUME_MA_PERIOD candles
+        """
         try:
-            if len(closes) < period + 1:
-                return 50
+            if len(klines) < max(period, VOLUME_MA_PERIOD) + 2:
+                return 50, 0
                 
-            deltas = [closes[i] - closes[i-1] for i in range(1, len(closes))]
-            gains = [d if d > 0 else 0 for d in deltas]
-            losses = [-d if d < 0 else 0 for d in deltas]
+            closes = klines.close
+            volumes = klines.volume
+            times = klines.ts
+            state = self._indicator_state.get(symbol)
             
-            avg_gain = sum(gains[:period]) / period
-            avg_loss = sum(losses[:period]) / period
+            if state is not None and state.open_time == times[-3]:
+                # One more candle closed since last update
+                self._commit_candle(state, closes[-2], volumes[-2], times[-2], period)
+            elif state is None or state.open_time != times[-2]:
+                state = self._seed_state(klines, period)
+                self._indicator_state[symbol] = state
             
-            for i in range(period, len(deltas)):
-                avg_gain = (avg_gain * 13 + gains[i]) / 14
-                avg_loss = (avg_loss * 13 + losses[i]) / 14
-            
-            if avg_loss == 0:
-                return 100
-                
-            rs = avg_gain / avg_loss
-            rsi = 100 - (100 / (1 + rs))
+            # Latest candle is applied without being committed
+            avg_gain, avg_loss = self._wilder_step(
+                state.avg_gain, state.avg_loss, closes[-1] - state.last_close, period
+            )
+            rsi = self._rsi_from_averages(avg_gain, avg_loss)
+            volume_ma = state.volume_sum / VOLUME_MA_PERIOD
+            volume_ratio = volumes[-1] / volume_ma if volume_ma > 0 else 0
             
-            return round(rsi, 2)
+            return rsi, float(volume_ratio)
             
         except Exception as e:
-            self.logger.error(f"Error calculating RSI: {str(e)}")
-            return 50
+            self.logger.error(f"Error updating indicators for {symbol}: {str(e)}")
+            self._indicator_state.pop(symbol, None)
+            return 50, 0
 
-    def _calculate_ema(self, data: List[float], period: int) -> float:
-        """Calculate Exponential Moving Average"""
+    def seed_batch(
+        self,
+        klines_by_symbol: Dict[str, Klines],
+        period: int = RSI_PERIOD
+    ) -> Dict[str, IndicatorState]:
+        """
+        Seed indicator state for many symbols with one parallel kernel call
+        
+        Symbols are grouped by history length so every group stacks into
+        a dense matrix. Symbols with too little history, or whose cached
+        state still lines up with the new candles (e.g. restored from
+        disk), are skipped and handled by update_indicators as usual.
+        
+        Cached state is only read, never written, so this can run on a
+        worker thread; the caller adopts the result with import_state.
+        
+        Parameters:
+            klines_by_symbol (Dict[str, Klines]): Fresh klines per symbol
+            period (int): RSI period
+            
+        Returns:
+            Dict[str, IndicatorState]: New state per seeded symbol
+        """
+        seeded: Dict[str, IndicatorState] = {}
         try:
-            if len(data) < period:
-                return data[-1]
-                
-            multiplier = 2 / (period + 1)
-            ema = sum(data[:period]) / period
+            min_length = max(period, VOLUME_MA_PERIOD) + 2
+            groups: Dict[int, List[str]] = {}
+            for symbol, klines in klines_by_symbol.items():
+                state = self._indicator_state.get(symbol)
+                if state is not None and state.open_time in klines.ts[-3:-1]:
+                    continue
+                if len(klines) >= min_length:
+                    groups.setdefault(len(klines), []).append(symbol)
             
-            for price in data[period:]:
-                ema = (price - ema) * multiplier + ema
+            for symbols in groups.values():
+                batch = [klines_by_symbol[s] for s in symbols]
+                avg_gains, avg_losses, volume_sums = seed_indicators_batch(
+                    np.stack([k.close[:-1] for k in batch]),
+                    np.stack([k.volume[:-1] for k in batch]),
+                    period,
+                    VOLUME_MA_PERIOD
+                )
                 
-            return ema
-            
+                for i, (symbol, klines) in enumerate(zip(symbols, batch)):
+                    seeded[symbol] = IndicatorState(
+                        avg_gain=float(avg_gains[i]),
+                        avg_loss=float(avg_losses[i]),
+                        last_close=float(klines.close[-2]),
+                        open_time=float(klines.ts[-2]),
+                        volumes=deque(
+                            klines.volume[-VOLUME_MA_PERIOD - 1:-1].tolist(),
+                            maxlen=VOLUME_MA_PERIOD
+                        ),
+                        volume_sum=float(volume_sums[i])
+                    )
+                    
         except Exception as e:
-            self.logger.error(f"Error calculating EMA: {str(e)}")
-            return data[-1]
+            self.logger.error(f"Error seeding indicator batch: {str(e)}")
+            
+        return seeded
 
-    def _calculate_atr(self, klines: List[Dict], period: int = 14) -> float:
-        """Calculate Average True Range"""
+    def screen_candidates(
+        self,
+        klines_by_symbol: Dict[str, Klines],
+        period: int = RSI_PERIOD
+    ) -> Tuple[List[str], Dict[str, IndicatorState]]:
+        """
+        Symbols whose current RSI and volume ratio could produce a signal
+        
+        Applies the open candle to every seeded state at once and keeps
+        symbols with extreme RSI and a volume breakout. A state one candle
+        behind (a candle closed on the kline stream) is advanced on a copy
+        first. Symbols without state in line with their candles are always
+        kept so the full per-symbol path decides.
+        
+        Cached state is not modified; the caller adopts the advanced
+        states with import_state.
+        
+        Parameters:
+            klines_by_symbol (Dict[str, Klines]): Klines per symbol, state
+                already seeded with seed_batch
+            period (int): RSI period
+            
+        Returns:
+            Tuple[List[str], Dict[str, IndicatorState]]: Symbols worth a
+            full analysis and the states advanced by one closed candle
+        """
+        advanced: Dict[str, IndicatorState] = {}
         try:
-            if len(klines) < period + 1:
-                return 0
-                
-            true_ranges = []
-            for i in range(1, len(klines)):
-                high = klines[i]['high']
-                low = klines[i]['low']
-                prev_close = klines[i-1]['close']
-                
-                tr1 = high - low
-                tr2 = abs(high - prev_close)
-                tr3 = abs(low - prev_close)
-                
-                true_ranges.append(max(tr1, tr2, tr3))
+            aligned = []
+            candidates = []
+            for symbol, klines in klines_by_symbol.items():
+                state = self._indicator_state.get(symbol)
+                if state is not None and len(klines) > 2 and state.open_time == klines.ts[-3]:
+                    # Same commit update_indicators would make
+                    state = self._advanced_state(
+                        state, klines.close[-2], klines.volume[-2], klines.ts[-2], period
+                    )
+                    advanced[symbol] = state
+                if state is not None and len(klines) > 1 and state.open_time == klines.ts[-2]:
+                    aligned.append((symbol, state, klines))
+                else:
+                    candidates.append(symbol)
+                    
+            if not aligned:
+                return candidates, advanced
                 
-            atr = sum(true_ranges[-period:]) / period
-            return round(atr, 8)
+            avg_gain = np.array([state.avg_gain for _, state, _ in aligned])
+            avg_loss = np.array([state.avg_loss for _, state, _ in aligned])
+            volume_sum = np.array([state.volume_sum for _, state, _ in aligned])
+            change = np.array([k.close[-1] - state.last_close for _, state, k in aligned])
+            volume = np.array([k.volume[-1] for _, _, k in aligned])
+            
+            # Same Wilder step and rounding as update_indicators, per column
+            avg_gain = (avg_gain * (period - 1) + np.maximum(change, 0.0)) / period
+            avg_loss = (avg_loss * (period - 1) + np.maximum(-change, 0.0)) / period
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rsi = np.where(avg_loss == 0, 100.0, 100 - 100 / (1 + avg_gain / avg_loss))
+                volume_ratio = np.where(
+                    volume_sum > 0, volume / (volume_sum / VOLUME_MA_PERIOD), 0.0
+                )
+            rsi = np.round(rsi, 2)
+            
+            mask = (
+                ((rsi <= RSI_OVERSOLD) | (rsi >= RSI_OVERBOUGHT))
+                & (volume_ratio >= VOLUME_RATIO_MIN)
+            )
+            candidates.extend(symbol for (symbol, _, _), hit in zip(aligned, mask) if hit)
+            return candidates, advanced
             
         except Exception as e:
-            self.logger.error(f"Error calculating ATR: {str(e)}")
-            return 0
+            self.logger.error(f"Error screening candidates: {str(e)}")
+            return list(klines_by_symbol), {}
+
+    def export_state(self) -> Dict[str, IndicatorState]:
+        """Snapshot of cached indicator state per symbol"""
+        return dict(self._indicator_state)
+
+    def import_state(self, states: Dict[str, IndicatorState]):
+        """Adopt indicator state (saved by a previous run, seeded or
+        screened), keeping any cached state that is already further along"""
+        for symbol, state in states.items():
+            current = self._indicator_state.get(symbol)
+            if current is None or current.open_time <= state.open_time:
+                self._indicator_state[symbol] = state
+
+    def _seed_state(self, klines: Klines, period: int) -> IndicatorState:
+        """Build indicator state from all closed candles"""
+        avg_gain, avg_loss, volume_sum = seed_indicators(
+            klines.close[:-1], klines.volume[:-1], period, VOLUME_MA_PERIOD
+        )
+        volumes = deque(klines.volume[-VOLUME_MA_PERIOD - 1:-1].tolist(), maxlen=VOLUME_MA_PERIOD)
+        
+        return IndicatorState(
+            avg_gain=avg_gain,
+            avg_loss=avg_loss,
+            last_close=float(klines.close[-2]),
+            open_time=float(klines.ts[-2]),
+            volumes=volumes,
+            volume_sum=volume_sum
+        )
+
+    def _advanced_state(
+        self,
+        state: IndicatorState,
+        close: float,
+        volume: float,
+        open_time: float,
+        period: int
+    ) -> IndicatorState:
+        """Copy of state with one more closed candle folded in"""
+        state = replace(state, volumes=deque(state.volumes, maxlen=VOLUME_MA_PERIOD))
+        self._commit_candle(state, close, volume, open_time, period)
+        return state
+
+    def _commit_candle(
+        self,
+        state: IndicatorState,
+        close: float,
+        volume: float,
+        open_time: float,
+        period: int
+    ):
+        """Fold one closed candle into indicator state"""
+        state.avg_gain, state.avg_loss = self._wilder_step(
+            state.avg_gain, state.avg_loss, close - state.last_close, period
+        )
+        state.last_close = float(close)
+        state.open_time = float(open_time)
+        
+        # Running sum over a full window: add newest, drop oldest
+        state.volume_sum += volume - state.volumes[0]
+        state.volumes.append(float(volume))
+
+    def _trend_indicators(self, klines: Klines) -> Tuple[float, float, float, float]:
+        """RSI, EMA20, EMA50 and ATR of the candles"""
+        rsi, ema20, ema50, atr = trend_indicators(
+            klines.high, klines.low, klines.close,
+            RSI_PERIOD, EMA_SHORT, EMA_LONG, ATR_PERIOD
+        )
+        return round(float(rsi), 2), float(ema20), float(ema50), round(float(atr), 8)
+
+    @staticmethod
+    def _wilder_step(
+        avg_gain: float,
+        avg_loss: float,
+        change: float,
+        period: int
+    ) -> Tuple[float, float]:
+        """Apply one price change to Wilder averages"""
+        change = float(change)
+        avg_gain = (avg_gain * (period - 1) + max(change, 0.0)) / period
+        avg_loss = (avg_loss * (period - 1) + max(-change, 0.0)) / period
+        return avg_gain, avg_loss
+
+    @staticmethod
+    def _rsi_from_averages(avg_gain: float, avg_loss: float) -> float:
+        """Convert smoothed averages to RSI value"""
+        if avg_loss == 0:
+            return 100
+            
+        rs = avg_gain / avg_loss
+        rsi = 100 - (100 / (1 + rs))
+        
+        return round(float(rsi), 2)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Indicator State Store
+Author: Anhbaza01
+Version: 1.0.0
+Last Updated: 2026-10-16 11:58:32 UTC
+
+Keeps incremental indicator state in SQLite so a restart can continue
+Wilder RSI and volume sums instead of reseeding every symbol
+"""
+
+import sqlite3
+import logging
+import orjson
+from collections import deque
+from typing import Dict, Optional
+from .constants import VOLUME_MA_PERIOD
+from .signal_processor import IndicatorState
+
+class StateStore:
+    def __init__(self, db_file: str, logger: Optional[logging.Logger] = None):
+        """
+        Initialize State Store
+
+        Parameters:
+            db_file (str): SQLite database path
+            logger (Logger): Optional logger instance
+        """
+        self.db_file = db_file
+        self.logger = logger or logging.getLogger(__name__)
+        self.conn = sqlite3.connect(db_file)
+        self.create_tables()
+
+    def create_tables(self):
+        """Create state table if missing"""
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS indicator_state (
+            symbol TEXT PRIMARY KEY,
+            avg_gain REAL NOT NULL,
+            avg_loss REAL NOT NULL,
+            last_close REAL NOT NULL,
+            open_time REAL NOT NULL,
+            volumes BLOB NOT NULL,
+            volume_sum REAL NOT NULL
+        )
+        """)
+        self.conn.commit()
+
+    def load(self) -> Dict[str, IndicatorState]:
+        """Load saved indicator state per symbol"""
+        try:
+            cursor = self.conn.execute("SELECT * FROM indicator_state")
+            states = {
+                symbol: IndicatorState(
+                    avg_gain=avg_gain,
+                    avg_loss=avg_loss,
+                    last_close=last_close,
+                    open_time=open_time,
+                    volumes=deque(orjson.loads(volumes), maxlen=VOLUME_MA_PERIOD),
+                    volume_sum=volume_sum
+                )
+                for symbol, avg_gain, avg_loss, last_close, open_time, volumes, volume_sum
+                in cursor.fetchall()
+            }
+            self.logger.info(f"[+] Loaded indicator state for {len(states)} symbols")
+            return states
+
+        except Exception as e:
+            self.logger.error(f"[-] Error loading indicator state: {str(e)}")
+            return {}
+
+    def save(self, states: Dict[str, IndicatorState]) -> bool:
+        """Replace saved indicator state"""
+        try:
+            with self.conn:
+                self.conn.execute("DELETE FROM indicator_state")
+                self.conn.executemany(
+                    "INSERT INTO indicator_state VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            symbol, state.avg_gain, state.avg_loss, state.last_close,
+                            state.open_time, orjson.dumps(list(state.volumes)),
+                            state.volume_sum
+                        )
+                        for symbol, state in states.items()
+                    ]
+                )
+            self.logger.info(f"[+] Saved indicator state for {len(states)} symbols")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"[-] Error saving indicator state: {str(e)}")
+            return False
+
+    def close(self):
+        """Close database connection"""
+        self.conn.close()
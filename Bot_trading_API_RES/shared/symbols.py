@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Symbol Filters
+Author: Anhbaza01
+Version: 1.0.0
+Last Updated: 2026-10-16 15:12:36 UTC
+
+Trading pair selection from Binance exchange info responses,
+shared by the spot bot and the futures client
+"""
+
+from typing import Any, Dict, List
+
+QUOTE_ASSET = "USDT"
+INDEX_SYMBOL_PREFIX = "DEFI"   # Composite index contracts, not a coin
+
+def usdt_trading_symbols(exchange_info: Dict[str, Any]) -> List[str]:
+    """
+    USDT-quoted symbols currently open for trading
+
+    Parameters:
+        exchange_info (Dict[str, Any]): Exchange info response (spot or futures)
+
+    Returns:
+        List[str]: Symbols in exchange order
+    """
+    # Single pass, cheapest and most selective check first
+    return [
+        s['symbol'] for s in exchange_info['symbols']
+        if s['status'] == 'TRADING'
+        and s['quoteAsset'] == QUOTE_ASSET
+        and not s['symbol'].startswith(INDEX_SYMBOL_PREFIX)
+    ]
+
+def price_decimals(exchange_info: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Price precision of every symbol, from its PRICE_FILTER tick size
+
+    Parameters:
+        exchange_info (Dict[str, Any]): Exchange info response (spot or futures)
+
+    Returns:
+        Dict[str, int]: Decimal places by symbol
+    """
+    decimals = {}
+    for s in exchange_info['symbols']:
+        for f in s['filters']:
+            if f['filterType'] == 'PRICE_FILTER':
+                # "0.01000000" -> 2, "1.00000000" -> 0
+                decimals[s['symbol']] = len(f['tickSize'].rstrip('0').split('.')[1])
+                break
+    return decimals
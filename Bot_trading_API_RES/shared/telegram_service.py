@@ -7,9 +7,33 @@ Last Updated: 2025-05-23 20:11:58 UTC
 """
 
 import logging
+import asyncio
 import aiohttp
-from typing import Dict, Any, Optional
-from datetime import datetime
+import orjson
+from typing import Dict, Any, List, Optional
+from .constants import (
+    BOT_USER,
+    TELEGRAM_BATCH_WINDOW,
+    TELEGRAM_BATCH_MAX,
+    TELEGRAM_BATCH_SEPARATOR,
+    TELEGRAM_MAX_MESSAGE_LENGTH,
+    TELEGRAM_QUEUE_MAX
+)
+from .time_utils import utc_now_str
+
+# Parsed once, only the values change per signal
+SIGNAL_TEMPLATE = (
+    "🚨 <b>New Trading Signal</b>\n\n"
+    "Symbol: {symbol}\n"
+    "Type: {type}\n"
+    "Entry: {entry:.{decimals}f}\n"
+    "Take Profit: {tp:.{decimals}f}\n"
+    "Stop Loss: {sl:.{decimals}f}\n"
+    "RSI: {rsi:.2f}\n"
+    "Confidence: {confidence}%\n\n"
+    "Time: {time} UTC\n"
+    "User: {user}"
+).format
 
 class TelegramService:
     def __init__(
@@ -30,7 +54,18 @@ class TelegramService:
         self.chat_id = chat_id
         self.logger = logger or logging.getLogger(__name__)
         self.api_url = f"https://api.telegram.org/bot{token}"
-        self.user = "Anhbaza01"
+        self.user = BOT_USER
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._signal_queue: Optional[asyncio.Queue] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """Shared keep-alive session, created on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                json_serialize=lambda obj: orjson.dumps(obj).decode()
+            )
+        return self._session
 
     async def send_message(self, text: str) -> bool:
         """Send text message to Telegram"""
@@ -42,54 +77,115 @@ class TelegramService:
                 "parse_mode": "HTML"
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=data) as response:
-                    self.logger.info(
-                        f"HTTP Request: POST {url} \"{response.status} {response.reason}\""
-                    )
+            session = self._ensure_session()
+            async with session.post(url, json=data) as response:
+                self.logger.info(
+                    f"HTTP Request: POST {url} \"{response.status} {response.reason}\""
+                )
                     
-                    if response.status == 200:
-                        return True
-                    else:
-                        self.logger.error(
-                            f"[-] Telegram API error: {response.status} {response.reason}"
-                        )
-                        return False
+                if response.status == 200:
+                    return True
+                else:
+                    self.logger.error(
+                        f"[-] Telegram API error: {response.status} {response.reason}"
+                    )
+                    return False
                         
         except Exception as e:
             self.logger.error(f"[-] Error sending Telegram message: {str(e)}")
             return False
 
     async def send_signal(self, signal: Dict[str, Any]) -> bool:
-        """Send trading signal notification"""
+        """Queue trading signal notification for the next batched send"""
         try:
-            # Format message
-            message = (
-                f"🚨 <b>New Trading Signal</b>\n\n"
-                f"Symbol: {signal['symbol']}\n"
-                f"Type: {signal['type']}\n"
-                f"Entry: {signal['entry']:.8f}\n"
-                f"Take Profit: {signal['tp']:.8f}\n"
-                f"Stop Loss: {signal['sl']:.8f}\n"
-                f"RSI: {signal['rsi']:.2f}\n"
-                f"Confidence: {signal.get('confidence', 0)}%\n\n"
-                f"Time: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC\n"
-                f"User: {self.user}"
-            )
-            
-            return await self.send_message(message)
+            return self.queue_message(self.format_signal(signal))
             
         except Exception as e:
             self.logger.error(f"[-] Error sending signal notification: {str(e)}")
             return False
 
+    def queue_message(self, text: str) -> bool:
+        """Queue message for the next batched send, the caller never waits on Telegram"""
+        if self._flush_task is None or self._flush_task.done():
+            self._signal_queue = asyncio.Queue(maxsize=TELEGRAM_QUEUE_MAX)
+            self._flush_task = asyncio.create_task(self._flush_signals())
+            
+        try:
+            self._signal_queue.put_nowait(text)
+            return True
+        except asyncio.QueueFull:
+            # Telegram is down or throttling us, keep memory bounded
+            self.logger.warning("[!] Telegram queue full, message dropped")
+            return False
+
+    def format_signal(self, signal: Dict[str, Any]) -> str:
+        """Format trading signal notification"""
+        return SIGNAL_TEMPLATE(
+            symbol=signal['symbol'],
+            type=signal['type'],
+            entry=signal['entry'],
+            tp=signal['tp'],
+            sl=signal['sl'],
+            decimals=signal.get('decimals', 8),
+            rsi=signal['rsi'],
+            confidence=signal.get('confidence', 0),
+            time=utc_now_str(),
+            user=self.user
+        )
+
+    async def _flush_signals(self):
+        """Send queued signals as combined messages every batch window"""
+        while True:
+            messages = [await self._signal_queue.get()]
+            await asyncio.sleep(TELEGRAM_BATCH_WINDOW)
+            while not self._signal_queue.empty():
+                messages.append(self._signal_queue.get_nowait())
+                
+            # None is queued by close() as the last item
+            await self._send_batch([m for m in messages if m is not None])
+            if messages[-1] is None:
+                return
+
+    async def _send_batch(self, messages: List[str]):
+        """Send messages joined together, up to TELEGRAM_BATCH_MAX per post
+        and split at Telegram's length limit"""
+        batch = ""
+        count = 0
+        for message in messages:
+            if batch and (
+                count >= TELEGRAM_BATCH_MAX or
+                len(batch) + len(TELEGRAM_BATCH_SEPARATOR) + len(message) > TELEGRAM_MAX_MESSAGE_LENGTH
+            ):
+                await self.send_message(batch)
+                batch = ""
+                count = 0
+            batch = f"{batch}{TELEGRAM_BATCH_SEPARATOR}{message}" if batch else message
+            count += 1
+        if batch:
+            await self.send_message(batch)
+
+    async def close(self):
+        """Send any signals still queued and close the HTTP session"""
+        try:
+            if self._flush_task and not self._flush_task.done():
+                await self._signal_queue.put(None)
+                await self._flush_task
+            self._flush_task = None
+            
+            if self._session:
+                await self._session.close()
+                self._session = None
+                
+        except Exception as e:
+            self.logger.error(f"[-] Error flushing Telegram signals: {str(e)}")
+
     async def send_error(self, error: str) -> bool:
         """Send error notification"""
         try:
             message = (
                 f"❌ <b>Error</b>\n\n"
                 f"{error}\n\n"
-                f"Time: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC\n"
+                f"Time: {utc_now_str()} UTC\n"
                 f"User: {self.user}"
             )
             
@@ -105,29 +201,29 @@ class TelegramService:
             # Get bot info
             url = f"{self.api_url}/getMe"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url) as response:
-                    self.logger.info(
-                        f"HTTP Request: POST {url} \"{response.status} {response.reason}\""
-                    )
+            session = self._ensure_session()
+            async with session.post(url) as response:
+                self.logger.info(
+                    f"HTTP Request: POST {url} \"{response.status} {response.reason}\""
+                )
                     
-                    if response.status == 200:
-                        data = await response.json()
-                        bot_name = data['result']['username']
-                        self.logger.info(f"[+] Connected to Telegram as {bot_name}")
+                if response.status == 200:
+                    data = await response.json(loads=orjson.loads)
+                    bot_name = data['result']['username']
+                    self.logger.info(f"[+] Connected to Telegram as {bot_name}")
                         
-                        # Send test message
-                        test_message = (
-                            f"🤖 Bot Connected\n"
-                            f"Time: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC\n"
-                            f"User: {self.user}"
-                        )
-                        return await self.send_message(test_message)
-                    else:
-                        self.logger.error(
-                            f"[-] Telegram API error: {response.status} {response.reason}"
-                        )
-                        return False
+                    # Send test message
+                    test_message = (
+                        f"🤖 Bot Connected\n"
+                        f"Time: {utc_now_str()} UTC\n"
+                        f"User: {self.user}"
+                    )
+                    return await self.send_message(test_message)
+                else:
+                    self.logger.error(
+                        f"[-] Telegram API error: {response.status} {response.reason}"
+                    )
+                    return False
                         
         except Exception as e:
             self.logger.error(f"[-] Error testing Telegram connection: {str(e)}")
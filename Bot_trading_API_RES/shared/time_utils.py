@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Time Utilities
+Author: Anhbaza01
+Version: 1.0.0
+Last Updated: 2026-10-16 10:41:05 UTC
+
+Cheap UTC timestamps for log lines and notifications
+"""
+
+import time
+from datetime import datetime, timezone
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# (epoch second, formatted string) of the last call
+_now_cache = (0, "")
+
+def utc_now_str() -> str:
+    """
+    Current UTC time as 'YYYY-mm-dd HH:MM:SS'
+
+    The string only changes once per second, so it is formatted once
+    per second and reused for every call within that second.
+
+    Returns:
+        str: Formatted UTC time
+    """
+    global _now_cache
+    now = int(time.time())
+    if now != _now_cache[0]:
+        _now_cache = (now, datetime.fromtimestamp(now, timezone.utc).strftime(TIME_FORMAT))
+    return _now_cache[1]
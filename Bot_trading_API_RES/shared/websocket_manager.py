@@ -12,13 +12,15 @@ This module manages WebSocket connections between bots, providing:
 - Connection status monitoring
 """
 
-import json
+import time
+import orjson
 import logging
 import asyncio
 import websockets
 from typing import Optional, Dict, Any, Callable, List
 from datetime import datetime
 from enum import Enum
+from .constants import BOT_USER
 
 class MessageType(Enum):
     """Message types for bot communication"""
@@ -61,10 +63,10 @@ class WebSocketManager:
         self._is_running = False
         self.reconnect_interval = reconnect_interval
         self.heartbeat_interval = heartbeat_interval
-        self.last_heartbeat = datetime.utcnow()
+        self.last_heartbeat = time.monotonic()
         self.connection_task = None
         self.heartbeat_task = None
-        self.user = "Anhbaza01"
+        self.user = BOT_USER
         self.version = "1.0.0"
         
         # Setup default handlers
@@ -108,11 +110,11 @@ class WebSocketManager:
                 }
             }
             
-            await self.websocket.send(json.dumps(identify_msg))
+            await self.websocket.send(self._dumps(identify_msg))
             self.logger.info(f"[+] Connected and identified as {self.name}")
             
             # Start heartbeat
-            self.last_heartbeat = datetime.utcnow()
+            self.last_heartbeat = time.monotonic()
             if self.heartbeat_task:
                 self.heartbeat_task.cancel()
             self.heartbeat_task = asyncio.create_task(self._heartbeat_loop())
@@ -149,7 +151,7 @@ class WebSocketManager:
                     "version": self.version
                 })
             
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(self._dumps(message))
             
             # Log message type and timestamp
             msg_type = message.get("type", "UNKNOWN")
@@ -164,6 +166,11 @@ class WebSocketManager:
             self.logger.error(f"[-] Error sending message: {str(e)}")
             return False
 
+    @staticmethod
+    def _dumps(message: Dict[str, Any]) -> str:
+        """Serialize message to JSON text (datetimes as ISO 8601)"""
+        return orjson.dumps(message, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
     def register_handler(self, message_type: str, handler: Callable):
         """
         Register message handler
@@ -177,7 +184,7 @@ class WebSocketManager:
 
     async def _handle_heartbeat(self, data: Dict[str, Any]):
         """Handle heartbeat message"""
-        self.last_heartbeat = datetime.utcnow()
+        self.last_heartbeat = time.monotonic()
         await self.send_message({
             "type": MessageType.HEARTBEAT.value,
             "data": {"status": "alive"}
@@ -218,7 +225,7 @@ class WebSocketManager:
                     
                 # Receive and parse message
                 message = await self.websocket.recv()
-                data = json.loads(message)
+                data = orjson.loads(message)
                 
                 # Log received message
                 msg_type = data.get("type", "UNKNOWN")
@@ -233,7 +240,7 @@ class WebSocketManager:
             except websockets.exceptions.ConnectionClosed:
                 self.logger.error("[-] WebSocket connection closed")
                 await self.reconnect()
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 self.logger.error("[-] Invalid JSON message received")
             except Exception as e:
                 self.logger.error(f"[-] Error processing message: {str(e)}")
@@ -302,17 +309,22 @@ class WebSocketManager:
                         continue
                 
                 # Calculate time since last heartbeat
-                heartbeat_age = (datetime.utcnow() - self.last_heartbeat).total_seconds()
+                heartbeat_age = time.monotonic() - self.last_heartbeat
                 
                 # If no heartbeat received for too long, reconnect
-                if heartbeat_age > self.heartbeat_interval * 2:
+                heartbeat_timeout = self.heartbeat_interval * 2
+                if heartbeat_age > heartbeat_timeout:
                     self.logger.warning(
                         f"[!] No heartbeat for {heartbeat_age:.1f}s, reconnecting..."
                     )
                     await self.reconnect()
                     continue
                 
-                await asyncio.sleep(1)
+                # Sleep to the heartbeat deadline rather than polling every
+                # second; closed sockets are also caught by listen()
+                await asyncio.sleep(
+                    min(heartbeat_timeout - heartbeat_age, self.reconnect_interval)
+                )
                 
             except Exception as e:
                 self.logger.error(f"[-] Connection check error: {str(e)}")
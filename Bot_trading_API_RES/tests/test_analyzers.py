@@ -9,9 +9,9 @@ from datetime import datetime
 from unittest.mock import Mock, patch, AsyncMock
 from typing import Dict, List
 
-from ..core.analyzer import MarketTrendAnalyzer, FuturesAnalyzer
-from ..core.models import MarketState, MarketTrend, SignalData
-from ..services import BinanceClient
+from core.analyzer import MarketTrendAnalyzer, FuturesAnalyzer
+from core.models import MarketState, MarketTrend, SignalData
+from services import BinanceClient
 
 class TestMarketTrendAnalyzer(unittest.TestCase):
     """Test cases for MarketTrendAnalyzer"""
@@ -0,0 +1,121 @@
+"""
+Test cases for cache utilities
+Tests ttl_cache expiry and in-flight sharing
+"""
+
+import unittest
+import asyncio
+from unittest.mock import Mock, patch
+
+from shared.cache import ttl_cache
+
+class TestTtlCache(unittest.IsolatedAsyncioTestCase):
+    """Test cases for ttl_cache"""
+
+    def setUp(self):
+        """Setup fake clock"""
+        self.clock = Mock()
+        self.clock.monotonic.return_value = 1000.0
+        patcher = patch('shared.cache.time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_sync_result_expires(self):
+        """Test a cached result is reused until the ttl passes"""
+        calls = []
+
+        @ttl_cache(60)
+        def fetch(symbol):
+            calls.append(symbol)
+            return len(calls)
+
+        self.assertEqual(fetch("BTCUSDT"), 1)
+        self.clock.monotonic.return_value = 1059.0
+        self.assertEqual(fetch("BTCUSDT"), 1)
+        self.assertEqual(fetch("ETHUSDT"), 2)
+
+        self.clock.monotonic.return_value = 1061.0
+        self.assertEqual(fetch("BTCUSDT"), 3)
+
+    def test_sync_error_not_cached(self):
+        """Test a failed call is retried on the next call"""
+        results = [ValueError("down"), 42]
+
+        @ttl_cache(60)
+        def fetch():
+            result = results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        with self.assertRaises(ValueError):
+            fetch()
+        self.assertEqual(fetch(), 42)
+
+    def test_cache_clear(self):
+        """Test cache_clear drops cached results"""
+        calls = []
+
+        @ttl_cache(60)
+        def fetch():
+            calls.append(None)
+            return len(calls)
+
+        self.assertEqual(fetch(), 1)
+        fetch.cache_clear()
+        self.assertEqual(fetch(), 2)
+
+    async def test_async_result_expires(self):
+        """Test an async result is reused until the ttl passes"""
+        calls = []
+
+        @ttl_cache(60)
+        async def fetch():
+            calls.append(None)
+            return len(calls)
+
+        self.assertEqual(await fetch(), 1)
+        self.assertEqual(await fetch(), 1)
+        self.clock.monotonic.return_value = 1061.0
+        self.assertEqual(await fetch(), 2)
+
+    async def test_async_calls_share_in_flight_request(self):
+        """Test concurrent callers await one call instead of starting their own"""
+        calls = []
+        release = asyncio.Event()
+
+        @ttl_cache(60)
+        async def fetch(symbol):
+            calls.append(symbol)
+            await release.wait()
+            return f"{symbol}:{len(calls)}"
+
+        tasks = [asyncio.create_task(fetch("BTCUSDT")) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        self.assertEqual(await asyncio.gather(*tasks), ["BTCUSDT:1"] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(await fetch("BTCUSDT"), "BTCUSDT:1")
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Test cancelling one waiter leaves the shared call running"""
+        release = asyncio.Event()
+
+        @ttl_cache(60)
+        async def fetch():
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(fetch())
+        second = asyncio.create_task(fetch())
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        self.assertEqual(await second, "done")
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+
+if __name__ == '__main__':
+    unittest.main()
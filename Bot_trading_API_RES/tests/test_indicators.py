@@ -0,0 +1,318 @@
+"""
+Test cases for indicator kernels and incremental indicator state
+Tests the Wilder RSI kernels against a pandas RSI and IndicatorState
+updates against a full recompute
+"""
+
+import sys
+import unittest
+import importlib
+import numpy as np
+from unittest.mock import patch
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+import shared
+from shared import indicators_numba
+from shared.constants import (
+    RSI_PERIOD,
+    VOLUME_MA_PERIOD,
+    EMA_SHORT,
+    EMA_LONG,
+    ATR_PERIOD
+)
+from shared.indicators_numba import rsi_wilder, seed_indicators
+from shared.klines import Klines
+from shared.signal_processor import SignalProcessor
+
+def make_rows(count: int, seed: int = 0) -> list:
+    """Random walk candles in Binance row order"""
+    rng = np.random.default_rng(seed)
+    closes = 100 + np.cumsum(rng.normal(0, 1, count))
+    volumes = rng.uniform(1, 100, count)
+    return [
+        [i * 60_000, close, close + 1, close - 1, close, volume]
+        for i, (close, volume) in enumerate(zip(closes, volumes))
+    ]
+
+def pandas_rsi(closes: np.ndarray, period: int = RSI_PERIOD) -> float:
+    """Wilder RSI with pandas: SMA seed, then ewm(alpha=1/period)"""
+    delta = pd.Series(closes).diff().dropna()
+
+    def wilder(values: 'pd.Series') -> float:
+        seeded = values.iloc[period - 1:].copy()
+        seeded.iloc[0] = values.iloc[:period].mean()
+        return seeded.ewm(alpha=1 / period, adjust=False).mean().iloc[-1]
+
+    avg_gain = wilder(delta.clip(lower=0))
+    avg_loss = wilder(-delta.clip(upper=0))
+    return 100.0 if avg_loss == 0 else 100 - 100 / (1 + avg_gain / avg_loss)
+
+def load_fallback_kernels():
+    """Import the kernels again with numba hidden, through the shim's fallback"""
+    names = ('_njit', 'indicators_numba')
+    attributes = {name: getattr(shared, name) for name in names}
+    try:
+        with patch.dict(sys.modules, {'numba': None}):
+            for name in names:
+                sys.modules.pop(f'shared.{name}', None)
+            return importlib.import_module('shared.indicators_numba')
+    finally:
+        # patch.dict restores sys.modules, the package attributes by hand
+        for name, module in attributes.items():
+            setattr(shared, name, module)
+
+def list_rsi(closes: list, period: int = RSI_PERIOD) -> float:
+    """Wilder RSI as the original list-based _calculate_rsi computed it"""
+    deltas = [closes[i] - closes[i - 1] for i in range(1, len(closes))]
+    gains = [d if d > 0 else 0 for d in deltas]
+    losses = [-d if d < 0 else 0 for d in deltas]
+
+    avg_gain = sum(gains[:period]) / period
+    avg_loss = sum(losses[:period]) / period
+    for i in range(period, len(deltas)):
+        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+
+    return 100.0 if avg_loss == 0 else 100 - 100 / (1 + avg_gain / avg_loss)
+
+class TestRsiKernels(unittest.TestCase):
+    """Test cases for rsi_wilder and seed_indicators"""
+
+    def setUp(self):
+        """Setup test data"""
+        self.klines = Klines.from_rows(make_rows(150))
+
+    def test_rsi_wilder_matches_list_rsi(self):
+        """Test kernel RSI against the original list implementation"""
+        closes = self.klines.close
+        self.assertAlmostEqual(
+            rsi_wilder(closes, RSI_PERIOD), list_rsi(closes.tolist()), places=8
+        )
+
+    @unittest.skipIf(pd is None, "pandas not installed")
+    def test_rsi_wilder_matches_pandas(self):
+        """Test kernel RSI against pandas"""
+        closes = self.klines.close
+        self.assertAlmostEqual(rsi_wilder(closes, RSI_PERIOD), pandas_rsi(closes), places=8)
+
+    def test_rsi_wilder_without_losses(self):
+        """Test rising closes give RSI 100"""
+        self.assertEqual(rsi_wilder(np.arange(1.0, 40.0), RSI_PERIOD), 100.0)
+
+    def test_seed_indicators_matches_list_rsi(self):
+        """Test seeded averages against the original list implementation"""
+        closes = self.klines.close
+        avg_gain, avg_loss, _ = seed_indicators(
+            closes, self.klines.volume, RSI_PERIOD, VOLUME_MA_PERIOD
+        )
+
+        rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+        self.assertAlmostEqual(rsi, list_rsi(closes.tolist()), places=8)
+
+    @unittest.skipIf(pd is None, "pandas not installed")
+    def test_seed_indicators_matches_pandas(self):
+        """Test seeded averages give the pandas RSI and volume sum"""
+        closes = self.klines.close
+        volumes = self.klines.volume
+        avg_gain, avg_loss, volume_sum = seed_indicators(
+            closes, volumes, RSI_PERIOD, VOLUME_MA_PERIOD
+        )
+
+        rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+        self.assertAlmostEqual(rsi, pandas_rsi(closes), places=8)
+        self.assertAlmostEqual(
+            volume_sum, pd.Series(volumes).iloc[-VOLUME_MA_PERIOD:].sum(), places=6
+        )
+
+    def test_seed_indicators_volume_sum(self):
+        """Test the trailing volume sum covers the last volume_period candles"""
+        _, _, volume_sum = seed_indicators(
+            self.klines.close, self.klines.volume, RSI_PERIOD, VOLUME_MA_PERIOD
+        )
+
+        self.assertAlmostEqual(
+            volume_sum, self.klines.volume[-VOLUME_MA_PERIOD:].sum(), places=6
+        )
+
+class TestIndicatorState(unittest.TestCase):
+    """Test cases for incremental IndicatorState updates"""
+
+    def setUp(self):
+        """Setup test data"""
+        self.rows = make_rows(200, seed=1)
+        self.processor = SignalProcessor()
+
+    def assert_same_state(self, state, expected):
+        """Compare two indicator states"""
+        self.assertAlmostEqual(state.avg_gain, expected.avg_gain, places=9)
+        self.assertAlmostEqual(state.avg_loss, expected.avg_loss, places=9)
+        self.assertEqual(state.last_close, expected.last_close)
+        self.assertEqual(state.open_time, expected.open_time)
+        self.assertAlmostEqual(state.volume_sum, expected.volume_sum, places=6)
+        self.assertEqual(list(state.volumes), list(expected.volumes))
+
+    def test_update_matches_full_recompute(self):
+        """Test N one-candle updates against seeding from the full history"""
+        for end in range(100, len(self.rows) + 1):
+            rsi, volume_ratio = self.processor.update_indicators(
+                "BTCUSDT", Klines.from_rows(self.rows[:end])
+            )
+
+        klines = Klines.from_rows(self.rows)
+        fresh = SignalProcessor()
+        expected_rsi, expected_ratio = fresh.update_indicators("BTCUSDT", klines)
+
+        self.assertAlmostEqual(rsi, expected_rsi, places=8)
+        self.assertAlmostEqual(volume_ratio, expected_ratio, places=8)
+        self.assert_same_state(
+            self.processor.export_state()["BTCUSDT"],
+            fresh.export_state()["BTCUSDT"]
+        )
+
+    def test_seed_batch_matches_update(self):
+        """Test batch seeding gives the same state as per-symbol seeding"""
+        klines_by_symbol = {
+            f"SYM{seed}USDT": Klines.from_rows(make_rows(100 + seed % 3, seed))
+            for seed in range(6)
+        }
+        self.processor.import_state(self.processor.seed_batch(klines_by_symbol))
+
+        for symbol, klines in klines_by_symbol.items():
+            fresh = SignalProcessor()
+            fresh.update_indicators(symbol, klines)
+            self.assert_same_state(
+                self.processor.export_state()[symbol],
+                fresh.export_state()[symbol]
+            )
+
+    def test_seed_batch_leaves_state_untouched(self):
+        """Test batch seeding returns new state instead of committing it"""
+        klines = Klines.from_rows(self.rows)
+        seeded = self.processor.seed_batch({"BTCUSDT": klines})
+
+        self.assertEqual(self.processor.export_state(), {})
+        self.assertIn("BTCUSDT", seeded)
+
+    def test_screen_candidates_leaves_state_untouched(self):
+        """Test screening returns the advanced state instead of committing it"""
+        before = Klines.from_rows(self.rows[:-1])
+        after = Klines.from_rows(self.rows)
+        self.processor.import_state(self.processor.seed_batch({"BTCUSDT": before}))
+        cached = self.processor.export_state()["BTCUSDT"]
+        open_time = cached.open_time
+
+        _, advanced = self.processor.screen_candidates({"BTCUSDT": after})
+        self.assertEqual(cached.open_time, open_time)
+
+        reference = SignalProcessor()
+        reference.update_indicators("BTCUSDT", before)
+        reference.update_indicators("BTCUSDT", after)
+        self.assert_same_state(advanced["BTCUSDT"], reference.export_state()["BTCUSDT"])
+
+    def test_import_state_keeps_newer_state(self):
+        """Test an older state does not replace a newer cached one"""
+        klines = Klines.from_rows(self.rows)
+        self.processor.update_indicators("BTCUSDT", klines)
+        newer = self.processor.export_state()["BTCUSDT"]
+
+        older = SignalProcessor()
+        older.update_indicators("BTCUSDT", Klines.from_rows(self.rows[:-5]))
+        self.processor.import_state(older.export_state())
+
+        self.assertIs(self.processor.export_state()["BTCUSDT"], newer)
+
+    def test_update_matches_list_rsi(self):
+        """Test the cached RSI against the original list implementation"""
+        klines = Klines.from_rows(self.rows)
+        rsi, _ = self.processor.update_indicators("BTCUSDT", klines)
+
+        self.assertAlmostEqual(rsi, list_rsi(klines.close.tolist()), places=2)
+
+    def test_gap_reseeds_state(self):
+        """Test candles that skip the cached one reseed from the full history"""
+        self.processor.update_indicators("BTCUSDT", Klines.from_rows(self.rows[:120]))
+        klines = Klines.from_rows(self.rows[:150])
+        self.processor.update_indicators("BTCUSDT", klines)
+
+        fresh = SignalProcessor()
+        fresh.update_indicators("BTCUSDT", klines)
+        self.assert_same_state(
+            self.processor.export_state()["BTCUSDT"],
+            fresh.export_state()["BTCUSDT"]
+        )
+
+class TestKernelFallback(unittest.TestCase):
+    """Test cases comparing compiled kernels with the pure-Python fallback"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Load the fallback kernels once"""
+        cls.fallback = load_fallback_kernels()
+
+    def setUp(self):
+        """Setup one matrix of histories, one row per symbol"""
+        rows = [make_rows(120, seed) for seed in range(8)]
+        self.klines = [Klines.from_rows(symbol_rows) for symbol_rows in rows]
+        self.close = np.vstack([klines.close for klines in self.klines])
+        self.volume = np.vstack([klines.volume for klines in self.klines])
+
+    def test_fallback_is_plain_python(self):
+        """Test the shim falls back to range and undecorated functions"""
+        self.assertIs(self.fallback.prange, range)
+        self.assertFalse(hasattr(self.fallback.seed_indicators_batch, 'py_func'))
+
+    def test_seed_indicators_batch_matches_fallback(self):
+        """Test the batch kernel on both paths and against per-row seeding"""
+        compiled = indicators_numba.seed_indicators_batch(
+            self.close, self.volume, RSI_PERIOD, VOLUME_MA_PERIOD
+        )
+        fallback = self.fallback.seed_indicators_batch(
+            self.close, self.volume, RSI_PERIOD, VOLUME_MA_PERIOD
+        )
+
+        for compiled_values, fallback_values in zip(compiled, fallback):
+            np.testing.assert_allclose(compiled_values, fallback_values, rtol=1e-9)
+        for i, (close, volume) in enumerate(zip(self.close, self.volume)):
+            np.testing.assert_allclose(
+                [values[i] for values in fallback],
+                self.fallback.seed_indicators(close, volume, RSI_PERIOD, VOLUME_MA_PERIOD),
+                rtol=1e-12
+            )
+
+    @unittest.skipIf(pd is None, "pandas not installed")
+    def test_batch_rsi_matches_pandas(self):
+        """Test RSI from both batch paths against pandas"""
+        for kernels in (indicators_numba, self.fallback):
+            avg_gain, avg_loss, _ = kernels.seed_indicators_batch(
+                self.close, self.volume, RSI_PERIOD, VOLUME_MA_PERIOD
+            )
+            rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+            np.testing.assert_allclose(
+                rsi, [pandas_rsi(close) for close in self.close], rtol=1e-9
+            )
+
+    def test_single_kernels_match_fallback(self):
+        """Test every single-symbol kernel on both paths"""
+        for klines in self.klines:
+            high, low, close, volume = klines.high, klines.low, klines.close, klines.volume
+            for name, args in (
+                ('rsi_wilder', (close, RSI_PERIOD)),
+                ('seed_indicators', (close, volume, RSI_PERIOD, VOLUME_MA_PERIOD)),
+                ('rsi_sma', (close, RSI_PERIOD)),
+                ('atr_sma', (high, low, close, ATR_PERIOD)),
+                ('directional_strength', (high, low, close, ATR_PERIOD)),
+                ('trend_indicators', (high, low, close, RSI_PERIOD, EMA_SHORT, EMA_LONG, ATR_PERIOD))
+            ):
+                with self.subTest(kernel=name):
+                    np.testing.assert_allclose(
+                        getattr(indicators_numba, name)(*args),
+                        getattr(self.fallback, name)(*args),
+                        rtol=1e-9
+                    )
+
+if __name__ == '__main__':
+    unittest.main()
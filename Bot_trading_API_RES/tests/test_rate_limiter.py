@@ -0,0 +1,72 @@
+"""
+Test cases for the request weight limiter
+Tests WeightLimiter against the X-MBX-USED-WEIGHT-1m header
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+
+from shared.rate_limiter import USED_WEIGHT_HEADER, WeightLimiter
+
+class TestWeightLimiter(unittest.IsolatedAsyncioTestCase):
+    """Test cases for WeightLimiter"""
+
+    def setUp(self):
+        """Setup limiter with a fake clock and sleep"""
+        self.limiter = WeightLimiter(limit=100)
+        self.now = 120.0
+        self.sleeps = []
+
+        async def sleep(seconds):
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+        for target, fake in (
+            ('shared.rate_limiter.time', Mock(time=lambda: self.now)),
+            ('shared.rate_limiter.asyncio', Mock(sleep=sleep))
+        ):
+            patcher = patch(target, fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_acquire_within_budget(self):
+        """Test a request that fits is not delayed"""
+        self.limiter.update({USED_WEIGHT_HEADER: "50"})
+        await self.limiter.acquire(5)
+
+        self.assertEqual(self.sleeps, [])
+        self.assertEqual(self.limiter.used, 55)
+
+    async def test_blocks_when_header_near_limit(self):
+        """Test a request waits for the next minute when the header is near the limit"""
+        self.now = 150.0
+        self.limiter.update({USED_WEIGHT_HEADER: "98"})
+        await self.limiter.acquire(5)
+
+        self.assertEqual(self.sleeps, [30.0])
+        self.assertEqual(self.limiter.used, 5)
+
+    async def test_header_does_not_lower_local_count(self):
+        """Test requests still in flight keep their reserved weight"""
+        await self.limiter.acquire(40)
+        self.limiter.update({USED_WEIGHT_HEADER: "10"})
+
+        self.assertEqual(self.limiter.used, 40)
+
+    async def test_missing_header_ignored(self):
+        """Test responses without the header leave usage unchanged"""
+        await self.limiter.acquire(3)
+        self.limiter.update({})
+
+        self.assertEqual(self.limiter.used, 3)
+
+    async def test_back_off_blocks_requests(self):
+        """Test requests wait out the Retry-After period"""
+        self.limiter.back_off(7)
+        await self.limiter.acquire(1)
+
+        self.assertEqual(self.sleeps, [7.0])
+        self.assertEqual(self.limiter.used, 1)
+
+if __name__ == '__main__':
+    unittest.main()
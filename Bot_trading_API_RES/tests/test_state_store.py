@@ -0,0 +1,62 @@
+"""
+Test cases for the indicator state store
+Tests saving and loading IndicatorState through SQLite
+"""
+
+import os
+import unittest
+import tempfile
+from collections import deque
+
+from shared.constants import VOLUME_MA_PERIOD
+from shared.signal_processor import IndicatorState
+from shared.state_store import StateStore
+
+class TestStateStore(unittest.TestCase):
+    """Test cases for StateStore"""
+
+    def setUp(self):
+        """Setup store in a temporary directory"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.db_file = os.path.join(directory.name, "state.db")
+
+        self.store = StateStore(self.db_file)
+        self.addCleanup(self.store.close)
+
+        self.states = {
+            symbol: IndicatorState(
+                avg_gain=0.5 + i,
+                avg_loss=0.25 + i,
+                last_close=100.0 + i,
+                open_time=1_700_000_000_000.0,
+                volumes=deque(
+                    (float(v) for v in range(i, i + VOLUME_MA_PERIOD)),
+                    maxlen=VOLUME_MA_PERIOD
+                ),
+                volume_sum=float(sum(range(i, i + VOLUME_MA_PERIOD)))
+            )
+            for i, symbol in enumerate(("BTCUSDT", "ETHUSDT"))
+        }
+
+    def test_round_trip(self):
+        """Test saved state loads back unchanged in a new store"""
+        self.assertTrue(self.store.save(self.states))
+
+        reopened = StateStore(self.db_file)
+        self.addCleanup(reopened.close)
+        loaded = reopened.load()
+
+        self.assertEqual(loaded, self.states)
+        for state in loaded.values():
+            self.assertEqual(state.volumes.maxlen, VOLUME_MA_PERIOD)
+
+    def test_save_replaces_previous_state(self):
+        """Test symbols missing from a later save are dropped"""
+        self.store.save(self.states)
+        self.store.save({"ETHUSDT": self.states["ETHUSDT"]})
+
+        self.assertEqual(list(self.store.load()), ["ETHUSDT"])
+
+if __name__ == '__main__':
+    unittest.main()
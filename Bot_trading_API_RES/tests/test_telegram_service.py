@@ -0,0 +1,57 @@
+"""
+Test cases for the Telegram service
+Tests how batched signals are split into messages
+"""
+
+import unittest
+from unittest.mock import AsyncMock
+
+from shared.constants import (
+    TELEGRAM_BATCH_MAX,
+    TELEGRAM_BATCH_SEPARATOR,
+    TELEGRAM_MAX_MESSAGE_LENGTH
+)
+from shared.telegram_service import TelegramService
+
+class TestSendBatch(unittest.IsolatedAsyncioTestCase):
+    """Test cases for TelegramService._send_batch"""
+
+    def setUp(self):
+        """Setup service with a mocked send"""
+        self.service = TelegramService(token="test_token", chat_id="test_chat")
+        self.service.send_message = AsyncMock(return_value=True)
+
+    def sent(self) -> list:
+        """Texts posted so far"""
+        return [call.args[0] for call in self.service.send_message.await_args_list]
+
+    async def test_split_at_batch_max(self):
+        """Test at most TELEGRAM_BATCH_MAX signals go into one message"""
+        messages = [f"signal {i}" for i in range(25)]
+        await self.service._send_batch(messages)
+
+        sent = self.sent()
+        self.assertEqual(
+            [len(text.split(TELEGRAM_BATCH_SEPARATOR)) for text in sent],
+            [TELEGRAM_BATCH_MAX, TELEGRAM_BATCH_MAX, 5]
+        )
+        self.assertEqual(TELEGRAM_BATCH_SEPARATOR.join(sent), TELEGRAM_BATCH_SEPARATOR.join(messages))
+
+    async def test_split_at_message_length(self):
+        """Test no message exceeds Telegram's length limit"""
+        messages = [str(i) * 1500 for i in range(5)]
+        await self.service._send_batch(messages)
+
+        sent = self.sent()
+        self.assertEqual(len(sent), 3)
+        self.assertTrue(all(len(text) <= TELEGRAM_MAX_MESSAGE_LENGTH for text in sent))
+        self.assertEqual(TELEGRAM_BATCH_SEPARATOR.join(sent), TELEGRAM_BATCH_SEPARATOR.join(messages))
+
+    async def test_empty_batch_sends_nothing(self):
+        """Test an empty batch posts no message"""
+        await self.service._send_batch([])
+
+        self.service.send_message.assert_not_awaited()
+
+if __name__ == '__main__':
+    unittest.main()
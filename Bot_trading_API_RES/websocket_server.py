@@ -8,10 +8,11 @@ Last Updated: 2025-05-23 19:58:23 UTC
 
 import asyncio
 import websockets
-import json
+import orjson
 import logging
 from datetime import datetime
 from typing import Dict, Set
+from shared.event_loop import install_event_loop_policy, shutdown_loop
 
 # Setup logging
 logging.basicConfig(
@@ -55,15 +56,15 @@ class WebSocketServer:
             elif name == "OrderManager":
                 self.order_manager = None
 
-    async def forward_message(self, sender: str, message: Dict):
-        """Forward message to appropriate recipient"""
+    async def forward_message(self, sender: str, message: str):
+        """Forward raw message text to appropriate recipient"""
         try:
             # Determine recipient based on message type and sender
             if sender == "TradingBot" and self.order_manager:
-                await self.order_manager.send(json.dumps(message))
+                await self.order_manager.send(message)
                 logger.info(f"[>] Message forwarded: TradingBot -> OrderManager")
             elif sender == "OrderManager" and self.trading_bot:
-                await self.trading_bot.send(json.dumps(message))
+                await self.trading_bot.send(message)
                 logger.info(f"[>] Message forwarded: OrderManager -> TradingBot")
             else:
                 logger.warning(f"[!] Cannot forward message, recipient not connected")
@@ -77,7 +78,7 @@ class WebSocketServer:
         try:
             async for message in websocket:
                 try:
-                    data = json.loads(message)
+                    data = orjson.loads(message)
                     
                     # Handle client identification
                     if data['type'] == 'IDENTIFY':
@@ -92,10 +93,10 @@ class WebSocketServer:
                         f"    Time: {data.get('timestamp', datetime.utcnow().isoformat())}"
                     )
                     
-                    # Forward message
-                    await self.forward_message(client_name, data)
+                    # Forward the original text, no need to re-encode
+                    await self.forward_message(client_name, message)
                     
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     logger.error("[-] Invalid JSON message received")
                     
         except websockets.exceptions.ConnectionClosed:
@@ -118,17 +119,17 @@ class WebSocketServer:
 
 def main():
     """Main entry point"""
+    # libuv event loop (uvloop / winloop), selector policy as fallback
+    install_event_loop_policy()
+    
+    # Create and set event loop
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    
     try:
         # Create server instance
         server = WebSocketServer()
         
-        # Set event loop policy for Windows
-        if asyncio.get_event_loop().is_closed():
-            asyncio.set_event_loop(asyncio.new_event_loop())
-            
-        # Get event loop
-        loop = asyncio.get_event_loop()
-        
         # Start server
         print(f"\n[*] Starting WebSocket server...")
         print(f"[*] Press Ctrl+C to stop")
@@ -140,8 +141,10 @@ def main():
     except Exception as e:
         print(f"\n[ERROR] Fatal error: {str(e)}")
     finally:
-        # Close event loop
-        loop.close()
+        try:
+            shutdown_loop(loop)
+        except Exception as e:
+            print(f"\n[ERROR] Error during shutdown: {str(e)}")
 
 if __name__ == "__main__":
     main()